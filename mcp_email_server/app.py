@@ -1,3 +1,6 @@
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from datetime import datetime
 from typing import Annotated, Literal
 
@@ -10,10 +13,29 @@ from mcp_email_server.config import (
     ProviderSettings,
     get_settings,
 )
+from mcp_email_server.emails.classic import close_smtp_connections
 from mcp_email_server.emails.dispatcher import dispatch_handler
-from mcp_email_server.emails.models import EmailOperationResult, EmailPageResponse, FolderInfo
+from mcp_email_server.emails.models import (
+    AccountFolders,
+    EmailOperationResult,
+    EmailPageResponse,
+    EmailPageResponseSoA,
+    FolderInfo,
+    MailboxEvent,
+)
+from mcp_email_server.emails.pool import get_pool
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+    try:
+        yield
+    finally:
+        await close_smtp_connections()
+        await get_pool().close()
 
-mcp = FastMCP("email")
+
+mcp = FastMCP("email", lifespan=lifespan)
 
 
 @mcp.resource("email://{account_name}")
@@ -22,6 +44,18 @@ async def get_account(account_name: str) -> EmailSettings | ProviderSettings | N
     return settings.get_account(account_name, masked=True)
 
 
+@mcp.resource(
+    "email://{account_name}/inbox/events",
+    description=(
+        "Wait up to 20 seconds for INBOX notifications (new or expunged emails) pushed by the server via IMAP IDLE. "
+        "Returns an empty list if nothing changed, read again to keep waiting."
+    ),
+)
+async def get_inbox_events(account_name: str) -> list[MailboxEvent]:
+    handler = dispatch_handler(account_name)
+    return await handler.wait_for_inbox_events()
+
+
 @mcp.tool()
 async def list_available_accounts() -> list[AccountAttributes]:
     settings = get_settings()
@@ -33,6 +67,9 @@ async def add_email_account(email: EmailSettings) -> None:
     settings = get_settings()
     settings.add_email(email)
     settings.store()
+    dispatch_handler.cache_clear()
+    # The dropped handlers would otherwise keep their SMTP sessions open with the keepalive
+    await close_smtp_connections()
 
 
 @mcp.tool(description="Paginate emails, page start at 1, before and since as UTC datetime.")
@@ -63,7 +100,14 @@ async def page_email(
         Literal["asc", "desc"],
         Field(default=None, description="Order emails by field. `asc` or `desc`."),
     ] = "desc",
-) -> EmailPageResponse:
+    layout: Annotated[
+        Literal["aos", "soa"],
+        Field(
+            default="aos",
+            description="`aos` returns a list of emails, `soa` returns one list per field (smaller for large pages).",
+        ),
+    ] = "aos",
+) -> EmailPageResponse | EmailPageResponseSoA:
     handler = dispatch_handler(account_name)
 
     return await handler.get_emails(
@@ -77,6 +121,7 @@ async def page_email(
         from_address=from_address,
         to_address=to_address,
         order=order,
+        layout=layout,
     )
 
 
@@ -107,9 +152,31 @@ async def send_email(
 )
 async def list_folders(
     account_name: Annotated[str, Field(description="The name of the email account.")],
+    with_counts: Annotated[
+        bool,
+        Field(default=False, description="Include the total and unseen message count of each folder."),
+    ] = False,
 ) -> list[FolderInfo]:
     handler = dispatch_handler(account_name)
-    return await handler.list_folders()
+    return await handler.list_folders(with_counts)
+
+
+@mcp.tool(
+    description="List all available folders/mailboxes in several email accounts concurrently.",
+)
+async def list_folders_all(
+    account_names: Annotated[list[str], Field(description="The names of the email accounts.")],
+) -> list[AccountFolders]:
+    # Each account is dispatched inside gather, so an unknown account is reported like any other failure
+    results = await asyncio.gather(
+        *(list_folders(account_name) for account_name in account_names), return_exceptions=True
+    )
+    return [
+        AccountFolders(account_name=account_name, error=str(result))
+        if isinstance(result, Exception)
+        else AccountFolders(account_name=account_name, folders=result)
+        for account_name, result in zip(account_names, results, strict=True)
+    ]
 
 
 @mcp.tool(
@@ -135,6 +202,36 @@ async def copy_emails(
     return await handler.copy_emails(uids, destination_folder)
 
 
+@mcp.tool(
+    description="Copy emails to another folder in several email accounts concurrently. Emails are identified by their UIDs.",
+)
+async def copy_emails_multi(
+    uids_by_account: Annotated[
+        dict[str, list[str]],
+        Field(description="Mapping of email account name to the list of email UIDs to copy."),
+    ],
+    destination_folder: Annotated[str, Field(description="The destination folder name.")],
+) -> dict[str, EmailOperationResult]:
+    account_names = list(uids_by_account)
+    results = await asyncio.gather(
+        *(
+            copy_emails(account_name, uids_by_account[account_name], destination_folder)
+            for account_name in account_names
+        ),
+        return_exceptions=True,
+    )
+    return {
+        account_name: EmailOperationResult(
+            success=False,
+            message=f"Copy operation failed: {result}",
+            failed_uids=uids_by_account[account_name],
+        )
+        if isinstance(result, Exception)
+        else result
+        for account_name, result in zip(account_names, results, strict=True)
+    }
+
+
 @mcp.tool(
     description="Move emails to another folder. Emails are identified by their UIDs.",
 )
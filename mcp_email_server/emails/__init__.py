@@ -1,13 +1,17 @@
-import abc
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Literal, Protocol
 
 if TYPE_CHECKING:
-    from mcp_email_server.emails.models import EmailOperationResult, EmailPageResponse, FolderInfo
+    from mcp_email_server.emails.models import (
+        EmailOperationResult,
+        EmailPageResponse,
+        EmailPageResponseSoA,
+        FolderInfo,
+        MailboxEvent,
+    )
 
 
-class EmailHandler(abc.ABC):
-    @abc.abstractmethod
+class EmailHandler(Protocol):
     async def get_emails(
         self,
         page: int = 1,
@@ -20,12 +24,12 @@ class EmailHandler(abc.ABC):
         from_address: str | None = None,
         to_address: str | None = None,
         order: str = "desc",
-    ) -> "EmailPageResponse":
+        layout: Literal["aos", "soa"] = "aos",
+    ) -> "EmailPageResponse | EmailPageResponseSoA":
         """
         Get emails
         """
 
-    @abc.abstractmethod
     async def send_email(
         self, recipients: list[str], subject: str, body: str, cc: list[str] | None = None, bcc: list[str] | None = None
     ) -> None:
@@ -33,25 +37,26 @@ class EmailHandler(abc.ABC):
         Send email
         """
 
-    @abc.abstractmethod
-    async def list_folders(self) -> list["FolderInfo"]:
+    async def list_folders(self, with_counts: bool = False) -> list["FolderInfo"]:
         """
-        List all available folders/mailboxes
+        List all available folders/mailboxes, optionally with their total and unseen message counts
+        """
+
+    async def wait_for_inbox_events(self) -> list["MailboxEvent"]:
+        """
+        Wait for the next INBOX change notifications (new or expunged emails)
         """
 
-    @abc.abstractmethod
     async def create_folder(self, folder_name: str) -> bool:
         """
         Create a new folder/mailbox
         """
 
-    @abc.abstractmethod
     async def copy_emails(self, uids: list[str], destination_folder: str) -> "EmailOperationResult":
         """
         Copy emails to another folder by UID
         """
 
-    @abc.abstractmethod
     async def move_emails(self, uids: list[str], destination_folder: str) -> "EmailOperationResult":
         """
         Move emails to another folder by UID
@@ -0,0 +1,89 @@
+import functools
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+_MISSING = object()
+
+
+class TTLCache:
+    """LRU cache whose entries expire ttl seconds after being stored.
+
+    Keys start with (host, user_name) so all entries of an account can be invalidated at once.
+    Each invalidation bumps the account's generation, so a value computed before it is not stored.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 300):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._generations: dict[tuple[str, str], int] = {}
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def generation(self, host: str, user_name: str) -> int:
+        """Return how often the entries of an account were invalidated."""
+        return self._generations.get((host, user_name), 0)
+
+    def invalidate(self, host: str, user_name: str) -> None:
+        """Drop all entries of an account."""
+        self._generations[(host, user_name)] = self.generation(host, user_name) + 1
+        for key in [key for key in self._data if key[:2] == (host, user_name)]:
+            del self._data[key]
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
+_cache = TTLCache()
+
+
+def get_cache() -> TTLCache:
+    return _cache
+
+
+def ttl_cached(
+    cache: TTLCache = _cache,
+) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """Cache an async EmailClient method per account and arguments."""
+
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs) -> T:
+            key = (
+                self.email_server.host,
+                self.email_server.user_name,
+                func.__name__,
+                args,
+                tuple(sorted(kwargs.items())),
+            )
+            value = cache.get(key, _MISSING)
+            if value is _MISSING:
+                generation = cache.generation(self.email_server.host, self.email_server.user_name)
+                value = await func(self, *args, **kwargs)
+                # Skip storing a value the server may have answered before an invalidating change
+                if cache.generation(self.email_server.host, self.email_server.user_name) == generation:
+                    cache.set(key, value)
+            return value
+
+        return wrapper
+
+    return decorator
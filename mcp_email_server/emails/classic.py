@@ -1,31 +1,165 @@
+import asyncio
+import codecs
+import contextlib
 import email.utils
-from collections.abc import AsyncGenerator
+import functools
+import re
+import weakref
+from collections.abc import AsyncGenerator, Callable, Iterable, Iterator
 from datetime import datetime
 from email.mime.text import MIMEText
 from email.parser import BytesParser
 from email.policy import default
-from typing import Any
+from itertools import islice
+from typing import Any, Literal
 
 import aioimaplib
 import aiosmtplib
 
 from mcp_email_server.config import EmailServer, EmailSettings
 from mcp_email_server.emails import EmailHandler
-from mcp_email_server.emails.models import EmailData, EmailOperationResult, EmailPageResponse, FolderInfo
+from mcp_email_server.emails.cache import get_cache, ttl_cached
+from mcp_email_server.emails.models import (
+    EmailData,
+    EmailOperationResult,
+    EmailPageResponse,
+    EmailPageResponseSoA,
+    FolderInfo,
+    MailboxEvent,
+)
+from mcp_email_server.emails.pool import MAX_CONNECTIONS_PER_ACCOUNT, AsyncIMAPPool, get_pool
 from mcp_email_server.log import logger
 
+# Maximum number of UIDs per bulk command, keeps each request under server line-length limits
+BULK_BATCH_SIZE = 100
+# Maximum number of connections fetching the batches of one page, including the one that searched
+FETCH_CONCURRENCY = MAX_CONNECTIONS_PER_ACCOUNT
+
+# Parse LIST response lines: (flags) "delimiter" "name", e.g. (\HasNoChildren) "." "INBOX.Sent"
+_LIST_RE = re.compile(rb'^\(([^)\n]*)\)[ \t]+"([^"\n]*)"[ \t]+"?([^"\n]*)"?$', re.MULTILINE)
+# Parse STATUS responses: "name" (MESSAGES 17 UNSEEN 3), as sent for STATUS and LIST-STATUS
+_STATUS_RE = re.compile(rb'^"?([^"\n]*?)"? \(([^()\n]*)\)$', re.MULTILINE)
+_STATUS_ITEM_RE = re.compile(rb"(MESSAGES|UNSEEN) (\d+)")
+_FETCH_UID_RE = re.compile(rb"UID (\d+)")
+_IDLE_EVENT_RE = re.compile(rb"(\d+) (EXISTS|EXPUNGE)\b")
+
+# IMAP dates use English month names regardless of locale (RFC 3501 date-month)
+_MONTHS = ("JAN", "FEB", "MAR", "APR", "MAY", "JUN", "JUL", "AUG", "SEP", "OCT", "NOV", "DEC")
+
+# Re-issue IDLE before the 30 minute inactivity limit servers may apply (RFC 2177)
+IDLE_TIMEOUT = 29 * 60
+# Seconds to wait for the server to acknowledge DONE
+IDLE_DONE_TIMEOUT = 10
+# Seconds a single wait_for_events call idles, well below MCP clients' request timeouts
+EVENTS_WAIT_TIMEOUT = 20
+
+# Seconds between NOOPs keeping an idle SMTP connection open between sends
+SMTP_KEEPALIVE_INTERVAL = 60
+
+# Clients holding an open SMTP connection, closed on server shutdown
+_smtp_clients: "weakref.WeakSet[EmailClient]" = weakref.WeakSet()
+
+
+def _batched(items: Iterable[str], size: int) -> Iterator[list[str]]:
+    """Split items into lists of at most size elements (itertools.batched is Python 3.12+)."""
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def _parse_fetch_response(lines: list[bytes | bytearray]) -> dict[str, bytes]:
+    """Map UIDs to message literals in a FETCH response, e.g. [b'1 FETCH (UID 7 BODY[] {42}', bytearray(...), b')']."""
+    messages = {}
+    uid = literal = None
+    for line in lines:
+        if isinstance(line, bytearray):
+            literal = bytes(line)
+        else:
+            if b"FETCH (" in line:
+                # Start of a new message
+                uid = literal = None
+            # The UID may come before or after the literal, e.g. b' UID 7)'
+            if uid is None and (match := _FETCH_UID_RE.search(line)):
+                uid = match.group(1).decode("utf-8")
+        if uid is not None and literal is not None:
+            messages[uid] = literal
+    return messages
+
+
+def _parse_status(listing: bytes) -> dict[str, dict[str, int | None]]:
+    """Map folder names to their total and unseen counts from STATUS response lines."""
+    counts = {}
+    for match in _STATUS_RE.finditer(listing):
+        items = dict(_STATUS_ITEM_RE.findall(match.group(2)))
+        counts[match.group(1).decode("utf-8")] = {
+            "total": int(items[b"MESSAGES"]) if b"MESSAGES" in items else None,
+            "unseen": int(items[b"UNSEEN"]) if b"UNSEEN" in items else None,
+        }
+    return counts
+
+
+_utf8_decode = codecs.getdecoder("utf-8")
+
+
+@functools.lru_cache(maxsize=64)
+def _get_decoder(charset: str) -> Callable[[bytes, str], tuple[str, int]]:
+    try:
+        codec = codecs.lookup(charset)
+    except LookupError:
+        # Unknown charset label in the message, treat the part as UTF-8
+        return _utf8_decode
+    # Like bytes.decode, refuse codecs that are not text encodings (e.g. zlib, base64, rot13)
+    return codec.decode if codec._is_text_encoding else _utf8_decode
+
+
+def _decode(payload: bytes, charset: str) -> str:
+    """Decode a MIME part, falling back to UTF-8 with replacement characters."""
+    try:
+        return _get_decoder(charset)(payload, "strict")[0]
+    except UnicodeDecodeError:
+        return _utf8_decode(payload, "replace")[0]
+
+
+def _imap_date(value: datetime) -> str:
+    """Format a date for IMAP SEARCH, e.g. 01-JAN-2023."""
+    return f"{value.day:02d}-{_MONTHS[value.month - 1]}-{value.year}"
+
+
+def _quote(value: str) -> str:
+    """Quote a string argument for an IMAP command (RFC 3501 quoted string).
+
+    Quoted strings cannot contain CR, LF or NUL. aioimaplib writes arguments verbatim, so a
+    line break would end the command and let the rest of the value run as a new one.
+    """
+    if any(char in value for char in "\r\n\0"):
+        raise ValueError(f"IMAP argument must not contain line breaks or NUL: {value!r}")
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
 
 class EmailClient:
-    def __init__(self, email_server: EmailServer, sender: str | None = None):
+    def __init__(
+        self,
+        email_server: EmailServer,
+        sender: str | None = None,
+        bulk_batch_size: int = BULK_BATCH_SIZE,
+        pool: AsyncIMAPPool | None = None,
+        fetch_concurrency: int = FETCH_CONCURRENCY,
+    ):
         self.email_server = email_server
         self.sender = sender or email_server.user_name
+        self.bulk_batch_size = bulk_batch_size
+        self.fetch_concurrency = fetch_concurrency
+        self._pool = pool or get_pool()
 
         self.imap_class = aioimaplib.IMAP4_SSL if self.email_server.use_ssl else aioimaplib.IMAP4
 
         self.smtp_use_tls = self.email_server.use_ssl
         self.smtp_start_tls = self.email_server.start_ssl
+        self._smtp: aiosmtplib.SMTP | None = None
+        self._smtp_lock = asyncio.Lock()
+        self._smtp_keepalive_task: asyncio.Task | None = None
 
-    def _parse_email_data(self, raw_email: bytes) -> dict[str, Any]:  # noqa: C901
+    def _parse_email_data(self, raw_email: bytes) -> dict[str, Any]:
         """Parse raw email data into a structured dictionary."""
         parser = BytesParser(policy=default)
         email_message = parser.parsebytes(raw_email)
@@ -60,20 +194,12 @@ class EmailClient:
                 elif content_type == "text/plain":
                     body_part = part.get_payload(decode=True)
                     if body_part:
-                        charset = part.get_content_charset("utf-8")
-                        try:
-                            body += body_part.decode(charset)
-                        except UnicodeDecodeError:
-                            body += body_part.decode("utf-8", errors="replace")
+                        body += _decode(body_part, part.get_content_charset("utf-8"))
         else:
             # Handle plain text emails
             payload = email_message.get_payload(decode=True)
             if payload:
-                charset = email_message.get_content_charset("utf-8")
-                try:
-                    body = payload.decode(charset)
-                except UnicodeDecodeError:
-                    body = payload.decode("utf-8", errors="replace")
+                body = _decode(payload, email_message.get_content_charset("utf-8"))
 
         return {
             "subject": subject,
@@ -83,7 +209,7 @@ class EmailClient:
             "attachments": attachments,
         }
 
-    async def get_emails_stream(  # noqa: C901
+    async def get_emails_stream(
         self,
         page: int = 1,
         page_size: int = 10,
@@ -96,18 +222,7 @@ class EmailClient:
         to_address: str | None = None,
         order: str = "desc",
     ) -> AsyncGenerator[dict[str, Any], None]:
-        imap = self.imap_class(self.email_server.host, self.email_server.port)
-        try:
-            # Wait for the connection to be established
-            await imap._client_task
-            await imap.wait_hello_from_server()
-
-            # Login and select inbox
-            await imap.login(self.email_server.user_name, self.email_server.password)
-            try:
-                await imap.id(name="mcp-email-server", version="1.0.0")
-            except Exception as e:
-                logger.warning(f"IMAP ID command failed: {e!s}")
+        async with self._pool.acquire(self.email_server, self.imap_class) as imap:
             await imap.select("INBOX")
 
             search_criteria = self._build_search_criteria(before, since, subject, body, text, from_address, to_address)
@@ -129,86 +244,206 @@ class EmailClient:
             if order == "desc":
                 message_ids.reverse()
 
-            # Fetch each message
-            for _, message_id in enumerate(message_ids[start:end]):
+            page_uids = [message_id.decode("utf-8") for message_id in message_ids[start:end]]
+
+            async for parsed_email in self._fetch_emails_parallel(imap, "INBOX", page_uids):
+                yield parsed_email
+
+    async def get_emails_incremental(
+        self, since_uid: int, folder: str = "INBOX"
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """Yield emails with a UID above since_uid, then wait with IMAP IDLE and yield new ones as they arrive."""
+        async with self._pool.acquire(self.email_server, self.imap_class) as imap:
+            await imap.select(folder)
+            last_uid = since_uid
+            while True:
+                _, messages = await imap.uid_search("UID", f"{last_uid + 1}:*")
+                message_ids = messages[0].split() if messages and messages[0] else []
+                # "n:*" always matches the highest UID, even when it is not above n
+                uids = [uid for uid in map(int, message_ids) if uid > last_uid]
+                async for parsed_email in self._fetch_emails(imap, [str(uid) for uid in uids]):
+                    yield parsed_email
+                if uids:
+                    last_uid = max(uids)
+
+                # Only search again once the server reports new messages
+                while not any(event.type == "exists" for event in await self._idle(imap)):
+                    pass
+
+    async def watch(self, folder: str = "INBOX") -> AsyncGenerator[MailboxEvent, None]:
+        """Yield EXISTS/EXPUNGE notifications pushed by the server with IMAP IDLE (RFC 2177)."""
+        async with self._pool.acquire(self.email_server, self.imap_class) as imap:
+            await imap.select(folder)
+            while True:
+                for event in await self._idle(imap):
+                    yield event
+
+    async def wait_for_events(self, folder: str = "INBOX", timeout: float = EVENTS_WAIT_TIMEOUT) -> list[MailboxEvent]:
+        """Wait with IMAP IDLE until the server pushes notifications for folder, or timeout seconds pass.
+
+        The pooled connection is held while waiting, so keep timeout short.
+        """
+        async with self._pool.acquire(self.email_server, self.imap_class) as imap:
+            await imap.select(folder)
+            return await self._idle(imap, timeout)
+
+    async def _idle(self, imap, timeout: float = IDLE_TIMEOUT) -> list[MailboxEvent]:
+        """Run one IDLE command until the server pushes a notification or timeout seconds pass."""
+        idle = await imap.idle_start(timeout=timeout)
+        try:
+            push = await imap.wait_server_push(timeout=timeout + IDLE_DONE_TIMEOUT)
+        finally:
+            imap.idle_done()
+            await asyncio.wait_for(idle, IDLE_DONE_TIMEOUT)
+
+        # aioimaplib queues one push per network read, take the rest too so the next IDLE
+        # on this pooled connection does not return them again
+        pushes = [push]
+        while not imap.protocol.idle_queue.empty():
+            pushes.append(imap.protocol.idle_queue.get_nowait())
+        events = [
+            MailboxEvent(type=match.group(2).decode("utf-8").lower(), number=int(match.group(1)))
+            for push in pushes
+            if push != aioimaplib.STOP_WAIT_SERVER_PUSH
+            for line in push
+            if isinstance(line, bytes) and (match := _IDLE_EVENT_RE.match(line))
+        ]
+        if events:
+            # Cached counts are stale once the mailbox changed
+            self._invalidate_cache()
+        return events
+
+    def _invalidate_cache(self) -> None:
+        get_cache().invalidate(self.email_server.host, self.email_server.user_name)
+
+    async def _fetch_emails(self, imap, uids: list[str]) -> AsyncGenerator[dict[str, Any], None]:
+        """Fetch and parse emails by UID, in the given order."""
+        # Fetch messages in bulk, one UID FETCH per sequence-set batch
+        for batch in _batched(uids, self.bulk_batch_size):
+            fetched = await self._fetch_uid_set(imap, ",".join(batch))
+            for uid in batch:
+                raw_email = fetched.get(uid)
+                if raw_email is None:
+                    # Missing from the bulk response, retry this UID on its own
+                    raw_email = await self._fetch_single_email(imap, uid)
+                if raw_email is None:
+                    continue
                 try:
-                    # Convert message_id from bytes to string
-                    message_id_str = message_id.decode("utf-8")
+                    parsed_email = self._parse_email_data(raw_email)
+                    # Add UID to the parsed email data
+                    parsed_email["uid"] = uid
+                    yield parsed_email
+                except Exception as e:
+                    # Log error but continue with other emails
+                    logger.error(f"Error parsing email: {e!s}")
+
+    async def _fetch_emails_parallel(self, imap, folder: str, uids: list[str]) -> AsyncGenerator[dict[str, Any], None]:
+        """Fetch and parse emails by UID, in the given order, overlapping the batches.
+
+        Batches are spread over imap and up to fetch_concurrency - 1 further pooled connections,
+        taking only connections that are free right now so a held one never waits for another.
+        """
+        batches = list(_batched(uids, self.bulk_batch_size))
+        async with contextlib.AsyncExitStack() as stack:
+            connections = [imap]
+            while len(connections) < min(self.fetch_concurrency, len(batches)):
+                try:
+                    batch_imap = await stack.enter_async_context(
+                        self._pool.try_acquire(self.email_server, self.imap_class)
+                    )
+                    if batch_imap is None:
+                        break
+                    await batch_imap.select(folder)
+                except Exception as e:
+                    # Servers often cap simultaneous sessions, fetch the rest on the connections already held
+                    logger.warning(f"Could not open another IMAP connection for fetching: {e}")
+                    break
+                connections.append(batch_imap)
+            # Each connection fetches its batches one at a time, in order
+            locks = [asyncio.Lock() for _ in connections]
+
+            async def fetch_batch(index: int) -> list[dict[str, Any]]:
+                async with locks[index % len(connections)]:
+                    connection = connections[index % len(connections)]
+                    return [parsed_email async for parsed_email in self._fetch_emails(connection, batches[index])]
+
+            tasks = [asyncio.create_task(fetch_batch(index)) for index in range(len(batches))]
+            try:
+                # Keep the page order regardless of which batch completes first
+                for task in tasks:
+                    for parsed_email in await task:
+                        yield parsed_email
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _fetch_uid_set(self, imap, uid_set: str) -> dict[str, bytes]:
+        """Fetch full messages by UID sequence-set (e.g. "1,2,3"). Returns raw emails keyed by UID."""
+        try:
+            _, data = await imap.uid("fetch", uid_set, "(UID BODY.PEEK[])")
+        except Exception as e:
+            logger.debug(f"Bulk fetch failed for UIDs {uid_set}: {e}")
+            return {}
+        return _parse_fetch_response(data or [])
 
-                    # Fetch the email using UID - try different formats for compatibility
-                    data = None
-                    fetch_formats = ["RFC822", "BODY[]", "BODY.PEEK[]", "(BODY.PEEK[])"]
-
-                    for fetch_format in fetch_formats:
-                        try:
-                            _, data = await imap.uid("fetch", message_id_str, fetch_format)
-
-                            if data and len(data) > 0:
-                                # Check if we got actual email content or just metadata
-                                has_content = False
-                                for item in data:
-                                    if (
-                                        isinstance(item, bytes)
-                                        and b"FETCH (" in item
-                                        and b"RFC822" not in item
-                                        and b"BODY" not in item
-                                    ):
-                                        # This is just metadata (like 'FETCH (UID 71998)'), not actual content
-                                        continue
-                                    elif isinstance(item, bytes | bytearray) and len(item) > 100:
-                                        # This looks like email content
-                                        has_content = True
-                                        break
-
-                                if has_content:
-                                    break
-                                else:
-                                    data = None  # Try next format
-
-                        except Exception as e:
-                            logger.debug(f"Fetch format {fetch_format} failed: {e}")
-                            data = None
-
-                    if not data:
-                        logger.error(f"Failed to fetch UID {message_id_str} with any format")
-                        continue
+    async def _fetch_single_email(self, imap, message_id_str: str) -> bytes | None:  # noqa: C901
+        """Fetch a single email by UID, trying several formats for compatibility."""
+        try:
+            data = None
+            fetch_formats = ["RFC822", "BODY[]", "BODY.PEEK[]", "(BODY.PEEK[])"]
 
-                    # Find the email data in the response
-                    raw_email = None
+            for fetch_format in fetch_formats:
+                try:
+                    _, data = await imap.uid("fetch", message_id_str, fetch_format)
 
-                    # The email content is typically at index 1 as a bytearray
-                    if len(data) > 1 and isinstance(data[1], bytearray):
-                        raw_email = bytes(data[1])
-                    else:
-                        # Search through all items for email content
+                    if data and len(data) > 0:
+                        # Check if we got actual email content or just metadata
+                        has_content = False
                         for item in data:
-                            if isinstance(item, bytes | bytearray) and len(item) > 100:
-                                # Skip IMAP protocol responses
-                                if isinstance(item, bytes) and b"FETCH" in item:
-                                    continue
-                                # This is likely the email content
-                                raw_email = bytes(item) if isinstance(item, bytearray) else item
+                            if (
+                                isinstance(item, bytes)
+                                and b"FETCH (" in item
+                                and b"RFC822" not in item
+                                and b"BODY" not in item
+                            ):
+                                # This is just metadata (like 'FETCH (UID 71998)'), not actual content
+                                continue
+                            elif isinstance(item, bytes | bytearray) and len(item) > 100:
+                                # This looks like email content
+                                has_content = True
                                 break
 
-                    if raw_email:
-                        try:
-                            parsed_email = self._parse_email_data(raw_email)
-                            # Add UID to the parsed email data
-                            parsed_email["uid"] = message_id_str
-                            yield parsed_email
-                        except Exception as e:
-                            # Log error but continue with other emails
-                            logger.error(f"Error parsing email: {e!s}")
-                    else:
-                        logger.error(f"Could not find email data in response for message ID: {message_id_str}")
+                        if has_content:
+                            break
+                        else:
+                            data = None  # Try next format
+
                 except Exception as e:
-                    logger.error(f"Error fetching message {message_id}: {e!s}")
-        finally:
-            # Ensure we logout properly
-            try:
-                await imap.logout()
-            except Exception as e:
-                logger.info(f"Error during logout: {e}")
+                    logger.debug(f"Fetch format {fetch_format} failed: {e}")
+                    data = None
+
+            if not data:
+                logger.error(f"Failed to fetch UID {message_id_str} with any format")
+                return None
+
+            # The email content is typically at index 1 as a bytearray
+            if len(data) > 1 and isinstance(data[1], bytearray):
+                return bytes(data[1])
+
+            # Search through all items for email content
+            for item in data:
+                if isinstance(item, bytes | bytearray) and len(item) > 100:
+                    # Skip IMAP protocol responses
+                    if isinstance(item, bytes) and b"FETCH" in item:
+                        continue
+                    # This is likely the email content
+                    return bytes(item) if isinstance(item, bytearray) else item
+
+            logger.error(f"Could not find email data in response for message ID: {message_id_str}")
+        except Exception as e:
+            logger.error(f"Error fetching message {message_id_str}: {e!s}")
+        return None
 
     @staticmethod
     def _build_search_criteria(
@@ -222,19 +457,19 @@ class EmailClient:
     ):
         search_criteria = []
         if before:
-            search_criteria.extend(["BEFORE", before.strftime("%d-%b-%Y").upper()])
+            search_criteria.extend(["BEFORE", _imap_date(before)])
         if since:
-            search_criteria.extend(["SINCE", since.strftime("%d-%b-%Y").upper()])
+            search_criteria.extend(["SINCE", _imap_date(since)])
         if subject:
-            search_criteria.extend(["SUBJECT", subject])
+            search_criteria.extend(["SUBJECT", _quote(subject)])
         if body:
-            search_criteria.extend(["BODY", body])
+            search_criteria.extend(["BODY", _quote(body)])
         if text:
-            search_criteria.extend(["TEXT", text])
+            search_criteria.extend(["TEXT", _quote(text)])
         if from_address:
-            search_criteria.extend(["FROM", from_address])
+            search_criteria.extend(["FROM", _quote(from_address)])
         if to_address:
-            search_criteria.extend(["TO", to_address])
+            search_criteria.extend(["TO", _quote(to_address)])
 
         # If no specific criteria, search for ALL
         if not search_criteria:
@@ -242,6 +477,7 @@ class EmailClient:
 
         return search_criteria
 
+    @ttl_cached()
     async def get_email_count(
         self,
         before: datetime | None = None,
@@ -252,26 +488,13 @@ class EmailClient:
         from_address: str | None = None,
         to_address: str | None = None,
     ) -> int:
-        imap = self.imap_class(self.email_server.host, self.email_server.port)
-        try:
-            # Wait for the connection to be established
-            await imap._client_task
-            await imap.wait_hello_from_server()
-
-            # Login and select inbox
-            await imap.login(self.email_server.user_name, self.email_server.password)
+        async with self._pool.acquire(self.email_server, self.imap_class) as imap:
             await imap.select("INBOX")
             search_criteria = self._build_search_criteria(before, since, subject, body, text, from_address, to_address)
             logger.info(f"Count: Search criteria: {search_criteria}")
             # Search for messages and count them - use UID SEARCH for consistency
             _, messages = await imap.uid_search(*search_criteria)
             return len(messages[0].split())
-        finally:
-            # Ensure we logout properly
-            try:
-                await imap.logout()
-            except Exception as e:
-                logger.info(f"Error during logout: {e}")
 
     async def send_email(
         self, recipients: list[str], subject: str, body: str, cc: list[str] | None = None, bcc: list[str] | None = None
@@ -288,122 +511,194 @@ class EmailClient:
         # Note: BCC recipients are not added to headers (they remain hidden)
         # but will be included in the actual recipients for SMTP delivery
 
-        async with aiosmtplib.SMTP(
-            hostname=self.email_server.host,
-            port=self.email_server.port,
-            start_tls=self.smtp_start_tls,
-            use_tls=self.smtp_use_tls,
-        ) as smtp:
-            await smtp.login(self.email_server.user_name, self.email_server.password)
-
-            # Create a combined list of all recipients for delivery
-            all_recipients = recipients.copy()
-            if cc:
-                all_recipients.extend(cc)
-            if bcc:
-                all_recipients.extend(bcc)
+        # Create a combined list of all recipients for delivery
+        all_recipients = recipients.copy()
+        if cc:
+            all_recipients.extend(cc)
+        if bcc:
+            all_recipients.extend(bcc)
 
+        smtp = await self.connect_smtp()
+        try:
             await smtp.send_message(msg, recipients=all_recipients)
-
-    async def list_folders(self) -> list[FolderInfo]:
-        """List all IMAP folders/mailboxes."""
-        imap = self.imap_class(self.email_server.host, self.email_server.port)
+        except Exception:
+            # The connection state is unknown, reconnect on the next send
+            await self._close_smtp(smtp)
+            raise
+
+    async def connect_smtp(self) -> aiosmtplib.SMTP:
+        """Return the logged-in SMTP connection, connecting on first use or after a disconnect."""
+        async with self._smtp_lock:
+            if self._smtp is None or not self._smtp.is_connected:
+                if self._smtp is not None:
+                    await self._close_smtp(self._smtp)
+                smtp = aiosmtplib.SMTP(
+                    hostname=self.email_server.host,
+                    port=self.email_server.port,
+                    start_tls=self.smtp_start_tls,
+                    use_tls=self.smtp_use_tls,
+                )
+                await smtp.connect()
+                try:
+                    await smtp.login(self.email_server.user_name, self.email_server.password)
+                except BaseException:
+                    await self._close_smtp(smtp)
+                    raise
+                self._smtp = smtp
+                self._smtp_keepalive_task = asyncio.create_task(self._smtp_keepalive(smtp))
+                _smtp_clients.add(self)
+            return self._smtp
+
+    async def close(self) -> None:
+        """Close the SMTP connection kept open between sends."""
+        if self._smtp is not None:
+            await self._close_smtp(self._smtp)
+
+    async def _smtp_keepalive(self, smtp: aiosmtplib.SMTP) -> None:
+        while True:
+            await asyncio.sleep(SMTP_KEEPALIVE_INTERVAL)
+            try:
+                await smtp.noop()
+            except Exception as e:
+                logger.info(f"SMTP keepalive failed: {e}")
+                await self._close_smtp(smtp)
+                return
+
+    async def _close_smtp(self, smtp: aiosmtplib.SMTP) -> None:
+        if self._smtp is smtp:
+            self._smtp = None
+            _smtp_clients.discard(self)
+            task, self._smtp_keepalive_task = self._smtp_keepalive_task, None
+            if task is not None and task is not asyncio.current_task():
+                task.cancel()
         try:
-            # Wait for the connection to be established
-            await imap._client_task
-            await imap.wait_hello_from_server()
-
-            # Login
-            await imap.login(self.email_server.user_name, self.email_server.password)
-
-            # List folders
-            _, folders = await imap.list("", "*")
-
-            folder_list = []
-            for folder_data in folders:
-                if isinstance(folder_data, bytes):
-                    folder_str = folder_data.decode('utf-8')
-                    # Parse folder response: (flags) "delimiter" "name"
-                    # Example: (\HasNoChildren) "." "INBOX.Sent"
-                    import re
-                    match = re.match(r'\(([^)]*)\)\s+"([^"]*)"\s+"?([^"]*)"?', folder_str)
-                    if match:
-                        flags_str, delimiter, name = match.groups()
-                        flags = [f.strip() for f in flags_str.split('\\') if f.strip()]
-                        folder_list.append(FolderInfo(
-                            name=name.strip('"'),
-                            delimiter=delimiter,
-                            flags=flags
-                        ))
-
-            return folder_list
-        finally:
+            await smtp.quit()
+        except Exception as e:
+            logger.info(f"Error during SMTP quit: {e}")
+            smtp.close()
+
+    @ttl_cached()
+    async def list_folders(self, with_counts: bool = False) -> list[FolderInfo]:
+        """List all IMAP folders/mailboxes, optionally with their total and unseen counts."""
+        async with self._pool.acquire(self.email_server, self.imap_class) as imap:
+            folders = None
+            if with_counts and imap.has_capability("LIST-STATUS"):
+                folders = await self._list_with_status(imap)
+            list_status = folders is not None
+            if not list_status:
+                _, folders = await imap.list("", "*")
+
+            # Scan the whole response in one pass, skipping literals and the status line
+            listing = b"\n".join(folder_data for folder_data in folders if isinstance(folder_data, bytes))
+            matches = list(_LIST_RE.finditer(listing))
+
+            counts = {}
+            if with_counts:
+                if not list_status:
+                    # Server lacks LIST-STATUS, fall back to one STATUS round-trip per folder
+                    listing = b"\n".join(await self._status_folders(imap, matches))
+                counts = _parse_status(listing)
+
+            folder_infos = []
+            for match in matches:
+                name = match.group(3).decode("utf-8")
+                folder_infos.append(
+                    FolderInfo.model_construct(
+                        name=name,
+                        delimiter=match.group(2).decode("utf-8"),
+                        flags=match.group(1).decode("utf-8").replace("\\", "").split(),
+                        **counts.get(name, {}),
+                    )
+                )
+            return folder_infos
+
+    async def _list_with_status(self, imap) -> list[bytes | bytearray] | None:
+        """List folders with their counts in one round-trip (RFC 5819 LIST-STATUS).
+
+        aioimaplib routes untagged responses to the pending command of the same name, so a
+        STATUS command that is never sent collects the STATUS responses while LIST runs.
+        Returns None if the server rejected the command.
+        """
+        # This relies on aioimaplib protocol internals, checked against aioimaplib 2.0.1.
+        # If they change, fall back to LIST plus one STATUS per folder.
+        try:
+            protocol = imap.protocol
+            status = aioimaplib.Command("STATUS", protocol.new_tag(), loop=protocol.loop)
+            command = aioimaplib.Command(
+                "LIST", protocol.new_tag(), '""', "*", "RETURN", "(STATUS (MESSAGES UNSEEN))", loop=protocol.loop
+            )
+            protocol.pending_async_commands["STATUS"] = status
+            try:
+                response = await asyncio.wait_for(protocol.execute(command), imap.timeout)
+            finally:
+                if protocol.pending_async_commands.get("STATUS") is status:
+                    del protocol.pending_async_commands["STATUS"]
+        except AttributeError as e:
+            logger.warning(f"LIST-STATUS unsupported by this aioimaplib version: {e}")
+            return None
+        if response.result != "OK":
+            logger.info(f"LIST-STATUS failed: {response.lines}")
+            return None
+        return response.lines + status.response.lines
+
+    async def _status_folders(self, imap, matches: list[re.Match[bytes]]) -> list[bytes]:
+        lines = []
+        for match in matches:
+            flags = match.group(1).lower()
+            if b"\\noselect" in flags or b"\\nonexistent" in flags:
+                continue
+            name = match.group(3).decode("utf-8")
             try:
-                await imap.logout()
+                _, status = await imap.status(_quote(name), "(MESSAGES UNSEEN)")
             except Exception as e:
-                logger.info(f"Error during logout: {e}")
+                logger.warning(f"STATUS failed for folder {name}: {e}")
+                continue
+            lines.extend(line for line in status if isinstance(line, bytes))
+        return lines
 
     async def create_folder(self, folder_name: str) -> bool:
         """Create a new IMAP folder/mailbox."""
-        imap = self.imap_class(self.email_server.host, self.email_server.port)
         try:
-            # Wait for the connection to be established
-            await imap._client_task
-            await imap.wait_hello_from_server()
-
-            # Login
-            await imap.login(self.email_server.user_name, self.email_server.password)
-
-            # Create folder
-            _, result = await imap.create(folder_name)
-            return result[0] == b'OK' if result else False
+            async with self._pool.acquire(self.email_server, self.imap_class) as imap:
+                # Create folder
+                result, _ = await imap.create(folder_name)
+                return result == "OK"
         except Exception as e:
             logger.error(f"Error creating folder {folder_name}: {e}")
             return False
         finally:
-            try:
-                await imap.logout()
-            except Exception as e:
-                logger.info(f"Error during logout: {e}")
+            # Invalidate once the command finished, so a listing running meanwhile cannot re-cache stale data
+            self._invalidate_cache()
 
     async def copy_emails(self, uids: list[str], destination_folder: str) -> EmailOperationResult:
         """Copy emails to another folder by UID."""
-        imap = self.imap_class(self.email_server.host, self.email_server.port)
         try:
-            # Wait for the connection to be established
-            await imap._client_task
-            await imap.wait_hello_from_server()
-
-            # Login and select inbox
-            await imap.login(self.email_server.user_name, self.email_server.password)
-            await imap.select("INBOX")
-
-            copied_count = 0
-            failed_uids = []
+            async with self._pool.acquire(self.email_server, self.imap_class) as imap:
+                await imap.select("INBOX")
 
-            for uid in uids:
-                try:
-                    # Copy email to destination folder
-                    _, result = await imap.uid('copy', uid, destination_folder)
-                    if result and result[0] == b'OK':
-                        copied_count += 1
-                    else:
-                        failed_uids.append(uid)
-                except Exception as e:
-                    logger.error(f"Error copying email UID {uid}: {e}")
-                    failed_uids.append(uid)
+                copied_count = 0
+                failed_uids = []
 
-            success = len(failed_uids) == 0
-            message = f"Successfully copied {copied_count} emails"
-            if failed_uids:
-                message += f", {len(failed_uids)} failed"
-
-            return EmailOperationResult(
-                success=success,
-                message=message,
-                copied_count=copied_count,
-                failed_uids=failed_uids
-            )
+                # Copy emails in bulk, one UID COPY per sequence-set batch
+                for batch in _batched(uids, self.bulk_batch_size):
+                    if await self._copy_uid_set(imap, ",".join(batch), destination_folder):
+                        copied_count += len(batch)
+                        continue
+                    # Server rejected the batch, retry one UID at a time to isolate failures
+                    for uid in batch:
+                        if await self._copy_uid_set(imap, uid, destination_folder):
+                            copied_count += 1
+                        else:
+                            failed_uids.append(uid)
+
+                success = len(failed_uids) == 0
+                message = f"Successfully copied {copied_count} emails"
+                if failed_uids:
+                    message += f", {len(failed_uids)} failed"
+
+                return EmailOperationResult(
+                    success=success, message=message, copied_count=copied_count, failed_uids=failed_uids
+                )
         except Exception as e:
             logger.error(f"Error in copy_emails: {e}")
             return EmailOperationResult(
@@ -412,51 +707,45 @@ class EmailClient:
                 failed_uids=uids
             )
         finally:
-            try:
-                await imap.logout()
-            except Exception as e:
-                logger.info(f"Error during logout: {e}")
+            self._invalidate_cache()
 
     async def move_emails(self, uids: list[str], destination_folder: str) -> EmailOperationResult:
         """Move emails to another folder by UID."""
-        imap = self.imap_class(self.email_server.host, self.email_server.port)
         try:
-            # Wait for the connection to be established
-            await imap._client_task
-            await imap.wait_hello_from_server()
-
-            # Login and select inbox
-            await imap.login(self.email_server.user_name, self.email_server.password)
-            await imap.select("INBOX")
-
-            moved_count = 0
-            failed_uids = []
-
-            # Process each UID
-            for uid in uids:
-                if await self._move_single_email(imap, uid, destination_folder):
-                    moved_count += 1
-                else:
-                    failed_uids.append(uid)
-
-            # Expunge deleted messages
-            if moved_count > 0:
-                try:
-                    await imap.expunge()
-                except Exception as e:
-                    logger.warning(f"Expunge failed: {e}")
+            async with self._pool.acquire(self.email_server, self.imap_class) as imap:
+                await imap.select("INBOX")
 
-            success = len(failed_uids) == 0
-            message = f"Successfully moved {moved_count} emails"
-            if failed_uids:
-                message += f", {len(failed_uids)} failed"
+                moved_count = 0
+                failed_uids = []
 
-            return EmailOperationResult(
-                success=success,
-                message=message,
-                moved_count=moved_count,
-                failed_uids=failed_uids
-            )
+                # Move emails in bulk, one command per sequence-set batch
+                for batch in _batched(uids, self.bulk_batch_size):
+                    uid_set = ",".join(batch)
+                    if await self._uid_move(imap, uid_set, destination_folder):
+                        moved_count += len(batch)
+                        continue
+                    if await self._copy_uid_set(imap, uid_set, destination_folder):
+                        # Already copied, only the deletion is left; copying again would duplicate them
+                        if await self._delete_uid_set(imap, uid_set):
+                            moved_count += len(batch)
+                        else:
+                            failed_uids.extend(batch)
+                        continue
+                    # Server rejected the batch before anything took effect, retry one UID at a time
+                    for uid in batch:
+                        if await self._move_single_email(imap, uid, destination_folder):
+                            moved_count += 1
+                        else:
+                            failed_uids.append(uid)
+
+                success = len(failed_uids) == 0
+                message = f"Successfully moved {moved_count} emails"
+                if failed_uids:
+                    message += f", {len(failed_uids)} failed"
+
+                return EmailOperationResult(
+                    success=success, message=message, moved_count=moved_count, failed_uids=failed_uids
+                )
         except Exception as e:
             logger.error(f"Error in move_emails: {e}")
             return EmailOperationResult(
@@ -465,33 +754,65 @@ class EmailClient:
                 failed_uids=uids
             )
         finally:
-            try:
-                await imap.logout()
-            except Exception as e:
-                logger.info(f"Error during logout: {e}")
+            self._invalidate_cache()
 
-    async def _move_single_email(self, imap, uid: str, destination_folder: str) -> bool:
-        """Move a single email by UID. Returns True if successful."""
+    async def _copy_uid_set(self, imap, uid_set: str, destination_folder: str) -> bool:
+        """Copy emails by UID sequence-set (e.g. "1,2,3"). Returns True if successful."""
         try:
-            # Try MOVE command first (RFC 6851)
-            _, result = await imap.uid('move', uid, destination_folder)
-            if result and result[0] == b'OK':
-                return True
+            result, _ = await imap.uid("copy", uid_set, destination_folder)
+            return result == "OK"
         except Exception as e:
-            logger.debug(f"MOVE command failed for UID {uid}, falling back to COPY+DELETE: {e}")
+            logger.error(f"Error copying email UIDs {uid_set}: {e}")
+            return False
+
+    async def _move_single_email(self, imap, uid: str, destination_folder: str) -> bool:
+        """Move a single email by UID, falling back to COPY+DELETE. Returns True if successful."""
+        if await self._uid_move(imap, uid, destination_folder):
+            return True
+        return await self._copy_uid_set(imap, uid, destination_folder) and await self._delete_uid_set(imap, uid)
 
-        # Fallback to COPY + STORE + EXPUNGE
+    async def _uid_move(self, imap, uid_set: str, destination_folder: str) -> bool:
+        """Move emails by UID sequence-set (e.g. "1,2,3") with MOVE (RFC 6851). Returns True if successful."""
         try:
-            # Copy email to destination
-            _, copy_result = await imap.uid('copy', uid, destination_folder)
-            if copy_result and copy_result[0] == b'OK':
-                # Mark as deleted
-                _, store_result = await imap.uid('store', uid, '+FLAGS.SILENT', '\\Deleted')
-                return store_result and store_result[0] == b'OK'
+            result, _ = await imap.uid("move", uid_set, destination_folder)
+            return result == "OK"
         except Exception as e:
-            logger.error(f"Fallback copy+delete failed for UID {uid}: {e}")
+            logger.debug(f"MOVE command failed for UIDs {uid_set}, falling back to COPY+DELETE: {e}")
+            return False
 
+    async def _delete_uid_set(self, imap, uid_set: str) -> bool:
+        """Flag copied emails as deleted and expunge them, retrying the STORE once. Returns True if successful."""
+        for _attempt in range(2):
+            try:
+                result, _ = await imap.uid("store", uid_set, "+FLAGS.SILENT", "\\Deleted")
+                if result == "OK":
+                    await self._expunge_uid_set(imap, uid_set)
+                    return True
+            except Exception as e:
+                logger.error(f"Marking UIDs {uid_set} as deleted failed: {e}")
         return False
+
+    async def _expunge_uid_set(self, imap, uid_set: str) -> None:
+        """Expunge only the given UIDs when the server supports UIDPLUS (RFC 4315).
+
+        A plain EXPUNGE scans the whole mailbox and also removes messages other sessions
+        flagged as deleted, so it is only used as a last resort.
+        """
+        try:
+            if imap.has_capability("UIDPLUS"):
+                await imap.uid("expunge", uid_set)
+            else:
+                await imap.expunge()
+        except Exception as e:
+            logger.warning(f"Expunge failed for UIDs {uid_set}: {e}")
+
+
+async def close_smtp_connections() -> None:
+    """Close the SMTP connections of all clients."""
+    for client in list(_smtp_clients):
+        await client.close()
+
+
 class ClassicEmailHandler(EmailHandler):
     def __init__(self, email_settings: EmailSettings):
         self.email_settings = email_settings
@@ -513,23 +834,35 @@ class ClassicEmailHandler(EmailHandler):
         from_address: str | None = None,
         to_address: str | None = None,
         order: str = "desc",
-    ) -> EmailPageResponse:
-        emails = []
-        async for email_data in self.incoming_client.get_emails_stream(
-            page, page_size, before, since, subject, body, text, from_address, to_address, order
-        ):
-            emails.append(EmailData.from_email(email_data))
-        total = await self.incoming_client.get_email_count(before, since, subject, body, text, from_address, to_address)
-        return EmailPageResponse(
-            page=page,
-            page_size=page_size,
-            before=before,
-            since=since,
-            subject=subject,
-            body=body,
-            text=text,
-            emails=emails,
-            total=total,
+        layout: Literal["aos", "soa"] = "aos",
+    ) -> EmailPageResponse | EmailPageResponseSoA:
+        async def fetch_emails() -> list[dict[str, Any]]:
+            return [
+                email_data
+                async for email_data in self.incoming_client.get_emails_stream(
+                    page, page_size, before, since, subject, body, text, from_address, to_address, order
+                )
+            ]
+
+        # Fetch the page and count the total over separate connections concurrently
+        emails, total = await asyncio.gather(
+            fetch_emails(),
+            self.incoming_client.get_email_count(before, since, subject, body, text, from_address, to_address),
+        )
+        page_fields = {
+            "page": page,
+            "page_size": page_size,
+            "before": before,
+            "since": since,
+            "subject": subject,
+            "body": body,
+            "text": text,
+            "total": total,
+        }
+        if layout == "soa":
+            return EmailPageResponseSoA.from_emails_fast(emails, **page_fields)
+        return EmailPageResponse.model_construct(
+            emails=[EmailData.from_email_fast(email_data) for email_data in emails], **page_fields
         )
 
     async def send_email(
@@ -537,8 +870,11 @@ class ClassicEmailHandler(EmailHandler):
     ) -> None:
         await self.outgoing_client.send_email(recipients, subject, body, cc, bcc)
 
-    async def list_folders(self) -> list[FolderInfo]:
-        return await self.incoming_client.list_folders()
+    async def list_folders(self, with_counts: bool = False) -> list[FolderInfo]:
+        return await self.incoming_client.list_folders(with_counts)
+
+    async def wait_for_inbox_events(self) -> list[MailboxEvent]:
+        return await self.incoming_client.wait_for_events("INBOX")
 
     async def create_folder(self, folder_name: str) -> bool:
         return await self.incoming_client.create_folder(folder_name)
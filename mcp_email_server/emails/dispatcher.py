@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 from typing import TYPE_CHECKING
 
 from mcp_email_server.config import EmailSettings, ProviderSettings, get_settings
@@ -9,7 +10,9 @@ if TYPE_CHECKING:
     from mcp_email_server.emails import EmailHandler
 
 
+@functools.lru_cache(maxsize=128)
 def dispatch_handler(account_name: str) -> EmailHandler:
+    """Return the handler for an account, cached until dispatch_handler.cache_clear() is called."""
     settings = get_settings()
     account = settings.get_account(account_name)
     if isinstance(account, ProviderSettings):
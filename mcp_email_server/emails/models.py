@@ -1,10 +1,12 @@
 from datetime import datetime
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import BaseModel
 
 
 class EmailData(BaseModel):
+    __slots__ = ()
+
     subject: str
     sender: str
     body: str
@@ -23,8 +25,22 @@ class EmailData(BaseModel):
             uid=email.get("uid"),
         )
 
+    @classmethod
+    def from_email_fast(cls, email: dict[str, Any]):
+        """Build from a dict produced by our own parser, skipping validation."""
+        return cls.model_construct(
+            subject=email["subject"],
+            sender=email["from"],
+            body=email["body"],
+            date=email["date"],
+            attachments=email["attachments"],
+            uid=email.get("uid"),
+        )
+
 
 class EmailPageResponse(BaseModel):
+    __slots__ = ()
+
     page: int
     page_size: int
     before: datetime | None
@@ -36,11 +52,65 @@ class EmailPageResponse(BaseModel):
     total: int
 
 
+class EmailPageResponseSoA(BaseModel):
+    """Page of emails stored column-wise, the i-th entry of each list belongs to the i-th email."""
+
+    __slots__ = ()
+
+    page: int
+    page_size: int
+    before: datetime | None
+    since: datetime | None
+    subject: str | None
+    body: str | None
+    text: str | None
+    subjects: list[str]
+    senders: list[str]
+    bodies: list[str]
+    dates: list[datetime]
+    attachments: list[list[str]]
+    uids: list[str | None]
+    total: int
+
+    @classmethod
+    def from_emails_fast(cls, emails: list[dict[str, Any]], **page: Any):
+        """Build from dicts produced by our own parser, skipping validation."""
+        return cls.model_construct(
+            subjects=[email["subject"] for email in emails],
+            senders=[email["from"] for email in emails],
+            bodies=[email["body"] for email in emails],
+            dates=[email["date"] for email in emails],
+            attachments=[email["attachments"] for email in emails],
+            uids=[email.get("uid") for email in emails],
+            **page,
+        )
+
+    def to_email_data(self) -> list[EmailData]:
+        return [
+            EmailData.model_construct(
+                subject=subject, sender=sender, body=body, date=date, attachments=attachments, uid=uid
+            )
+            for subject, sender, body, date, attachments, uid in zip(
+                self.subjects, self.senders, self.bodies, self.dates, self.attachments, self.uids, strict=True
+            )
+        ]
+
+
 class FolderInfo(BaseModel):
     """Information about an IMAP folder/mailbox."""
     name: str
     delimiter: str
     flags: list[str]
+    total: int | None = None  # Only filled in when listing with counts
+    unseen: int | None = None
+
+
+class AccountFolders(BaseModel):
+    """Folders of a single account in a multi-account listing."""
+
+    account_name: str
+    folders: list[FolderInfo] = []
+    error: str | None = None
 
 
 class EmailOperationResult(BaseModel):
@@ -50,3 +120,10 @@ class EmailOperationResult(BaseModel):
     moved_count: int = 0
     copied_count: int = 0
     failed_uids: list[str] = []
+
+
+class MailboxEvent(BaseModel):
+    """Mailbox change pushed by the server during IMAP IDLE."""
+
+    type: Literal["exists", "expunge"]
+    number: int  # Message count for EXISTS, expunged message sequence number for EXPUNGE
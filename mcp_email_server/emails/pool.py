@@ -0,0 +1,156 @@
+import asyncio
+import time
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+
+import aioimaplib
+
+from mcp_email_server.config import EmailServer
+from mcp_email_server.log import logger
+
+MAX_CONNECTIONS_PER_ACCOUNT = 3
+MAX_CONNECTION_AGE = 30 * 60  # Seconds, recycle connections before servers drop them
+
+PoolKey = tuple[str, int, str]
+
+
+class AsyncIMAPPool:
+    """Pool of logged-in IMAP connections, keyed by (host, port, user_name).
+
+    Connections are returned to the pool instead of being logged out, so repeated
+    operations on the same account skip the TLS handshake and LOGIN. Idle connections
+    are health-checked with NOOP on checkout and logged out once older than max_age.
+    """
+
+    def __init__(
+        self,
+        max_connections_per_account: int = MAX_CONNECTIONS_PER_ACCOUNT,
+        max_age: float = MAX_CONNECTION_AGE,
+    ):
+        self.max_connections_per_account = max_connections_per_account
+        self.max_age = max_age
+        self._idle: dict[PoolKey, asyncio.Queue[tuple[float, aioimaplib.IMAP4]]] = {}
+        self._slots: dict[PoolKey, asyncio.Semaphore] = {}
+
+    @staticmethod
+    def _key(email_server: EmailServer) -> PoolKey:
+        return (email_server.host, email_server.port, email_server.user_name)
+
+    @asynccontextmanager
+    async def acquire(
+        self, email_server: EmailServer, imap_class: Callable[[str, int], aioimaplib.IMAP4]
+    ) -> AsyncIterator[aioimaplib.IMAP4]:
+        """Check out a logged-in connection, returning it to the pool on exit.
+
+        Connections whose block raised are logged out instead, as their state is unknown.
+        """
+        key = self._key(email_server)
+        slots = self._slots.setdefault(key, asyncio.Semaphore(self.max_connections_per_account))
+
+        async with slots, self._use(key, email_server, imap_class) as imap:
+            yield imap
+
+    @asynccontextmanager
+    async def try_acquire(
+        self, email_server: EmailServer, imap_class: Callable[[str, int], aioimaplib.IMAP4]
+    ) -> AsyncIterator[aioimaplib.IMAP4 | None]:
+        """Like acquire, but yield None instead of waiting when the account has no free slot.
+
+        Callers already holding a connection must use this for further ones, waiting for a
+        slot while holding another can deadlock the account.
+        """
+        key = self._key(email_server)
+        slots = self._slots.setdefault(key, asyncio.Semaphore(self.max_connections_per_account))
+        if slots.locked():
+            yield None
+            return
+
+        async with slots, self._use(key, email_server, imap_class) as imap:
+            yield imap
+
+    @asynccontextmanager
+    async def _use(
+        self, key: PoolKey, email_server: EmailServer, imap_class: Callable[[str, int], aioimaplib.IMAP4]
+    ) -> AsyncIterator[aioimaplib.IMAP4]:
+        idle = self._idle.setdefault(key, asyncio.Queue())
+        created_at, imap = await self._checkout(idle, email_server, imap_class)
+        try:
+            yield imap
+        except BaseException:
+            await self._evict(imap)
+            raise
+
+        if time.monotonic() - created_at < self.max_age:
+            idle.put_nowait((created_at, imap))
+        else:
+            await self._evict(imap)
+
+    async def close(self) -> None:
+        """Log out all idle connections."""
+        for idle in self._idle.values():
+            while not idle.empty():
+                _, imap = idle.get_nowait()
+                await self._evict(imap)
+
+    async def _checkout(
+        self,
+        idle: asyncio.Queue[tuple[float, aioimaplib.IMAP4]],
+        email_server: EmailServer,
+        imap_class: Callable[[str, int], aioimaplib.IMAP4],
+    ) -> tuple[float, aioimaplib.IMAP4]:
+        while not idle.empty():
+            created_at, imap = idle.get_nowait()
+            if time.monotonic() - created_at >= self.max_age:
+                await self._evict(imap)
+                continue
+            try:
+                result, _ = await imap.noop()
+                if result == "OK":
+                    return created_at, imap
+                logger.info(f"Pooled IMAP connection failed health check: {result}")
+            except Exception as e:
+                logger.info(f"Pooled IMAP connection failed health check: {e}")
+            await self._evict(imap)
+
+        return time.monotonic(), await self._connect(email_server, imap_class)
+
+    async def _connect(
+        self, email_server: EmailServer, imap_class: Callable[[str, int], aioimaplib.IMAP4]
+    ) -> aioimaplib.IMAP4:
+        imap = imap_class(email_server.host, email_server.port)
+        try:
+            # Wait for the connection to be established
+            await imap._client_task
+            await imap.wait_hello_from_server()
+
+            result, lines = await imap.login(email_server.user_name, email_server.password)
+        except BaseException:
+            await self._evict(imap)
+            raise
+        if result != "OK":
+            # aioimaplib returns a rejected LOGIN instead of raising
+            await self._evict(imap)
+            raise ConnectionError(f"IMAP login failed: {lines}")
+
+        try:
+            await imap.id(name="mcp-email-server", version="1.0.0")
+        except Exception as e:
+            logger.warning(f"IMAP ID command failed: {e!s}")
+        return imap
+
+    @staticmethod
+    async def _evict(imap: aioimaplib.IMAP4) -> None:
+        try:
+            await imap.logout()
+        except Exception as e:
+            logger.info(f"Error during logout: {e}")
+
+
+_pool: AsyncIMAPPool | None = None
+
+
+def get_pool() -> AsyncIMAPPool:
+    global _pool
+    if _pool is None:
+        _pool = AsyncIMAPPool()
+    return _pool
@@ -4,11 +4,14 @@ import asyncio
 import os
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from mcp_email_server.config import EmailServer, EmailSettings, ProviderSettings, delete_settings
+from mcp_email_server.emails.cache import get_cache
+from mcp_email_server.emails.classic import close_smtp_connections
+from mcp_email_server.emails.dispatcher import dispatch_handler
 
 _HERE = Path(__file__).resolve().parent
 
@@ -19,9 +22,24 @@ os.environ["MCP_EMAIL_SERVER_LOG_LEVEL"] = "DEBUG"
 @pytest.fixture(autouse=True)
 def patch_env(monkeypatch: pytest.MonkeyPatch, tmp_path: pytest.TempPathFactory):
     delete_settings()
+    dispatch_handler.cache_clear()
     yield
 
 
+@pytest.fixture(autouse=True)
+def reset_imap_state(monkeypatch: pytest.MonkeyPatch):
+    """Give each test a fresh shared IMAP connection pool and an empty cache."""
+    monkeypatch.setattr("mcp_email_server.emails.pool._pool", None)
+    get_cache().clear()
+
+
+@pytest.fixture(autouse=True)
+async def reset_smtp_state():
+    """Close SMTP connections left open by a test, stopping their keepalive tasks."""
+    yield
+    await close_smtp_connections()
+
+
 @pytest.fixture
 def email_server():
     """Fixture for a test EmailServer."""
@@ -68,21 +86,31 @@ def provider_settings():
     )
 
 
-@pytest.fixture
-def mock_imap():
-    """Fixture for a mocked IMAP client."""
+def _make_mock_imap() -> AsyncMock:
     mock_imap = AsyncMock()
     mock_imap._client_task = asyncio.Future()
     mock_imap._client_task.set_result(None)
     mock_imap.wait_hello_from_server = AsyncMock()
-    mock_imap.login = AsyncMock()
-    mock_imap.select = AsyncMock()
-    mock_imap.search = AsyncMock(return_value=(None, [b"1 2 3"]))
-    mock_imap.fetch = AsyncMock(return_value=(None, [b"HEADER", bytearray(b"EMAIL CONTENT")]))
+    mock_imap.login = AsyncMock(return_value=("OK", [b"LOGIN completed"]))
+    mock_imap.noop = AsyncMock(return_value=("OK", []))
     mock_imap.logout = AsyncMock()
+    mock_imap.has_capability = MagicMock(return_value=False)
+    mock_imap.protocol.idle_queue = asyncio.Queue()
     return mock_imap
 
 
+@pytest.fixture
+def make_mock_imap():
+    """Fixture returning a factory of connected IMAP client mocks, for tests needing several."""
+    return _make_mock_imap
+
+
+@pytest.fixture
+async def mock_imap():
+    """Fixture for a mocked IMAP client, tests only override the commands they exercise."""
+    return _make_mock_imap()
+
+
 @pytest.fixture
 def mock_smtp():
     """Fixture for a mocked SMTP client."""
@@ -0,0 +1,106 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from mcp_email_server.emails.cache import TTLCache, ttl_cached
+
+
+class TestTTLCache:
+    def test_get_set(self):
+        """Test storing and reading entries."""
+        cache = TTLCache()
+        cache.set(("host", "user", "key"), 1)
+
+        assert cache.get(("host", "user", "key")) == 1
+        assert cache.get(("host", "user", "missing")) is None
+        assert cache.get(("host", "user", "missing"), "default") == "default"
+
+    def test_expiry(self):
+        """Test entries expire after ttl seconds."""
+        cache = TTLCache(ttl=10)
+        with patch("mcp_email_server.emails.cache.time.monotonic", return_value=100):
+            cache.set(("host", "user", "key"), 1)
+        with patch("mcp_email_server.emails.cache.time.monotonic", return_value=109):
+            assert cache.get(("host", "user", "key")) == 1
+        with patch("mcp_email_server.emails.cache.time.monotonic", return_value=110):
+            assert cache.get(("host", "user", "key")) is None
+
+    def test_evicts_least_recently_used(self):
+        """Test the least recently used entry is dropped beyond maxsize."""
+        cache = TTLCache(maxsize=2)
+        cache.set(("host", "user", "a"), 1)
+        cache.set(("host", "user", "b"), 2)
+        cache.get(("host", "user", "a"))
+        cache.set(("host", "user", "c"), 3)
+
+        assert cache.get(("host", "user", "a")) == 1
+        assert cache.get(("host", "user", "b")) is None
+        assert cache.get(("host", "user", "c")) == 3
+
+    def test_invalidate(self):
+        """Test invalidating only drops entries of the given account."""
+        cache = TTLCache()
+        cache.set(("host", "user", "a"), 1)
+        cache.set(("host", "other", "a"), 2)
+
+        cache.invalidate("host", "user")
+
+        assert cache.get(("host", "user", "a")) is None
+        assert cache.get(("host", "other", "a")) == 2
+
+    @pytest.mark.asyncio
+    async def test_ttl_cached(self, email_server):
+        """Test the decorator caches per account and arguments."""
+        cache = TTLCache()
+        calls = []
+
+        class Client:
+            def __init__(self, email_server):
+                self.email_server = email_server
+
+            @ttl_cached(cache)
+            async def count(self, value):
+                calls.append(value)
+                return value * 2
+
+        client = Client(email_server)
+
+        assert await client.count(1) == 2
+        assert await client.count(1) == 2
+        assert await client.count(2) == 4
+        assert calls == [1, 2]
+
+        cache.invalidate(email_server.host, email_server.user_name)
+
+        assert await client.count(1) == 2
+        assert calls == [1, 2, 1]
+
+    @pytest.mark.asyncio
+    async def test_ttl_cached_skips_value_invalidated_while_computing(self, email_server):
+        """Test a value computed across an invalidation is returned but not stored."""
+        cache = TTLCache()
+        answered = asyncio.Event()
+        release = asyncio.Event()
+        calls = []
+
+        class Client:
+            def __init__(self, email_server):
+                self.email_server = email_server
+
+            @ttl_cached(cache)
+            async def count(self):
+                calls.append(len(calls))
+                answered.set()
+                await release.wait()
+                return len(calls)
+
+        client = Client(email_server)
+        pending = asyncio.create_task(client.count())
+        await answered.wait()
+        cache.invalidate(email_server.host, email_server.user_name)
+        release.set()
+
+        assert await pending == 1
+        assert await client.count() == 2
+        assert await client.count() == 2
@@ -5,7 +5,7 @@ import pytest
 
 from mcp_email_server.config import EmailServer, EmailSettings
 from mcp_email_server.emails.classic import ClassicEmailHandler, EmailClient
-from mcp_email_server.emails.models import EmailData, EmailPageResponse
+from mcp_email_server.emails.models import EmailData, EmailPageResponse, EmailPageResponseSoA
 
 
 @pytest.fixture
@@ -112,6 +112,38 @@ class TestClassicEmailHandler:
                 )
                 mock_count.assert_called_once_with(now, None, "Test", None, None, "sender@example.com", None)
 
+    @pytest.mark.asyncio
+    async def test_get_emails_soa_layout(self, classic_handler):
+        """Test get_emails returns column-wise data with layout="soa"."""
+        now = datetime.now()
+        email_data = [
+            {"subject": "First", "from": "a@example.com", "body": "A", "date": now, "attachments": [], "uid": "1"},
+            {
+                "subject": "Second",
+                "from": "b@example.com",
+                "body": "B",
+                "date": now,
+                "attachments": ["b.pdf"],
+                "uid": "2",
+            },
+        ]
+
+        mock_stream = AsyncMock()
+        mock_stream.__aiter__.return_value = email_data
+
+        with patch.object(classic_handler.incoming_client, "get_emails_stream", return_value=mock_stream):
+            with patch.object(classic_handler.incoming_client, "get_email_count", AsyncMock(return_value=2)):
+                result = await classic_handler.get_emails(page=1, page_size=500, layout="soa")
+
+                assert isinstance(result, EmailPageResponseSoA)
+                assert result.page_size == 500
+                assert result.total == 2
+                assert result.subjects == ["First", "Second"]
+                assert result.senders == ["a@example.com", "b@example.com"]
+                assert result.attachments == [[], ["b.pdf"]]
+                assert result.uids == ["1", "2"]
+                assert result.to_email_data() == [EmailData.from_email(email) for email in email_data]
+
     @pytest.mark.asyncio
     async def test_send_email(self, classic_handler):
         """Test send_email method."""
@@ -85,3 +85,18 @@ class TestDispatcher:
             # Verify get_account was called correctly
             mock_settings.get_account.assert_called_once_with("nonexistent_account")
             mock_settings.get_accounts.assert_called_once()
+
+    def test_dispatch_handler_is_cached(self, email_settings):
+        """Test dispatch_handler reuses the handler until the cache is cleared."""
+        mock_settings = MagicMock()
+        mock_settings.get_account.return_value = email_settings
+
+        with patch("mcp_email_server.emails.dispatcher.get_settings", return_value=mock_settings):
+            handler = dispatch_handler("test_account")
+
+            assert dispatch_handler("test_account") is handler
+            mock_settings.get_account.assert_called_once_with("test_account")
+
+            dispatch_handler.cache_clear()
+
+            assert dispatch_handler("test_account") is not handler
@@ -1,13 +1,21 @@
 import asyncio
 import email
+import zlib
 from datetime import datetime
 from email.mime.text import MIMEText
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import aioimaplib
 import pytest
 
 from mcp_email_server.config import EmailServer
-from mcp_email_server.emails.classic import EmailClient
+from mcp_email_server.emails.classic import (
+    BULK_BATCH_SIZE,
+    EVENTS_WAIT_TIMEOUT,
+    EmailClient,
+    _parse_fetch_response,
+    close_smtp_connections,
+)
 
 
 @pytest.fixture
@@ -34,6 +42,7 @@ class TestEmailClient:
         assert client.sender == email_server.user_name
         assert client.smtp_use_tls is True
         assert client.smtp_start_tls is False
+        assert client.bulk_batch_size == BULK_BATCH_SIZE
 
         # Test with custom sender
         custom_sender = "Custom <custom@example.com>"
@@ -60,6 +69,29 @@ class TestEmailClient:
         assert isinstance(result["date"], datetime)
         assert result["attachments"] == []
 
+    def test_parse_email_data_charsets(self):
+        """Test body decoding with declared, unknown and mismatched charsets."""
+        client = EmailClient(MagicMock())
+
+        def parse(charset: str, payload: bytes) -> str:
+            raw_email = b"Subject: Test\r\nContent-Type: text/plain; charset=%s\r\n\r\n%s" % (charset.encode(), payload)
+            return client._parse_email_data(raw_email)["body"]
+
+        assert parse("iso-8859-1", b"caf\xe9") == "caf\u00e9"
+        assert parse("x-unknown", b"caf\xc3\xa9") == "caf\u00e9"
+        assert parse("utf-8", b"caf\xe9") == "caf\ufffd"
+
+    def test_parse_email_data_non_text_charsets(self):
+        """Test charset labels naming non-text codecs are decoded as UTF-8, not with the codec."""
+        client = EmailClient(MagicMock())
+
+        for charset, payload in [("zlib", zlib.compress(b"x" * 1000)), ("base64", b"aGVsbG8="), ("rot13", b"uryyb")]:
+            raw_email = b"Subject: Test\r\nContent-Type: text/plain; charset=%s\r\n\r\n%s" % (charset.encode(), payload)
+            body = client._parse_email_data(raw_email)["body"]
+
+            assert isinstance(body, str)
+            assert body == payload.decode("utf-8", errors="replace")
+
     def test_parse_email_data_with_attachments(self):
         """Test parsing email with attachments."""
         # This would require creating a multipart email with attachments
@@ -113,41 +145,49 @@ class TestEmailClient:
         criteria = EmailClient._build_search_criteria(since=since_date)
         assert criteria == ["SINCE", "01-JAN-2023"]
 
+        # Test month names do not depend on the locale
+        criteria = EmailClient._build_search_criteria(before=datetime(2023, 12, 31), since=datetime(2023, 5, 9))
+        assert criteria == ["BEFORE", "31-DEC-2023", "SINCE", "09-MAY-2023"]
+
         # Test with subject
         criteria = EmailClient._build_search_criteria(subject="Test")
-        assert criteria == ["SUBJECT", "Test"]
+        assert criteria == ["SUBJECT", '"Test"']
 
         # Test with body
         criteria = EmailClient._build_search_criteria(body="Test")
-        assert criteria == ["BODY", "Test"]
+        assert criteria == ["BODY", '"Test"']
 
         # Test with text
         criteria = EmailClient._build_search_criteria(text="Test")
-        assert criteria == ["TEXT", "Test"]
+        assert criteria == ["TEXT", '"Test"']
 
         # Test with from_address
         criteria = EmailClient._build_search_criteria(from_address="test@example.com")
-        assert criteria == ["FROM", "test@example.com"]
+        assert criteria == ["FROM", '"test@example.com"']
 
         # Test with to_address
         criteria = EmailClient._build_search_criteria(to_address="test@example.com")
-        assert criteria == ["TO", "test@example.com"]
+        assert criteria == ["TO", '"test@example.com"']
 
         # Test with multiple criteria
         criteria = EmailClient._build_search_criteria(
             subject="Test", from_address="test@example.com", since=datetime(2023, 1, 1)
         )
-        assert criteria == ["SINCE", "01-JAN-2023", "SUBJECT", "Test", "FROM", "test@example.com"]
+        assert criteria == ["SINCE", "01-JAN-2023", "SUBJECT", '"Test"', "FROM", '"test@example.com"']
+
+        # Test quoting of spaces, quotes and backslashes
+        criteria = EmailClient._build_search_criteria(subject='Q3 "final" \\ draft')
+        assert criteria == ["SUBJECT", '"Q3 \\"final\\" \\\\ draft"']
+
+    def test_build_search_criteria_rejects_line_breaks(self):
+        """Test values that would end the IMAP command early are refused."""
+        for value in ["x\r\nA1 DELETE INBOX", "x\nA1 DELETE INBOX", "x\0"]:
+            with pytest.raises(ValueError):
+                EmailClient._build_search_criteria(subject=value)
 
     @pytest.mark.asyncio
-    async def test_get_emails_stream(self, email_client):
+    async def test_get_emails_stream(self, email_client, mock_imap):
         """Test getting emails stream."""
-        # Mock IMAP client
-        mock_imap = AsyncMock()
-        mock_imap._client_task = asyncio.Future()
-        mock_imap._client_task.set_result(None)
-        mock_imap.wait_hello_from_server = AsyncMock()
-        mock_imap.login = AsyncMock()
         mock_imap.select = AsyncMock()
         mock_imap.search = AsyncMock(return_value=(None, [b"1 2 3"]))
         mock_imap.uid_search = AsyncMock(return_value=(None, [b"1 2 3"]))
@@ -159,16 +199,20 @@ Subject: Test Subject\r
 Date: Mon, 1 Jan 2024 00:00:00 +0000\r
 \r
 This is the email body."""
-        mock_imap.uid = AsyncMock(
-            return_value=(None, [b"1 FETCH (UID 1 RFC822 {%d}" % len(test_email), bytearray(test_email)])
-        )
-        mock_imap.logout = AsyncMock()
+        fetch_response = []
+        for seq, uid in enumerate([3, 2, 1], start=1):
+            fetch_response += [
+                b"%d FETCH (UID %d BODY[] {%d}" % (seq, uid, len(test_email)),
+                bytearray(test_email),
+                b")",
+            ]
+        mock_imap.uid = AsyncMock(return_value=(None, fetch_response))
 
         # Mock IMAP class
         with patch.object(email_client, "imap_class", return_value=mock_imap):
             # Mock _parse_email_data
             with patch.object(email_client, "_parse_email_data") as mock_parse:
-                mock_parse.return_value = {
+                mock_parse.side_effect = lambda raw_email: {
                     "subject": "Test Subject",
                     "from": "sender@example.com",
                     "body": "Test Body",
@@ -184,6 +228,7 @@ This is the email body."""
                 assert len(emails) == 3
                 assert emails[0]["subject"] == "Test Subject"
                 assert emails[0]["from"] == "sender@example.com"
+                assert [email_data["uid"] for email_data in emails] == ["3", "2", "1"]
 
                 # Verify IMAP methods were called correctly
                 mock_imap.login.assert_called_once_with(
@@ -191,22 +236,156 @@ This is the email body."""
                 )
                 mock_imap.select.assert_called_once_with("INBOX")
                 mock_imap.uid_search.assert_called_once_with("ALL")
-                assert mock_imap.uid.call_count == 3
-                mock_imap.logout.assert_called_once()
+                mock_imap.uid.assert_called_once_with("fetch", "3,2,1", "(UID BODY.PEEK[])")
+                mock_imap.logout.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_emails_stream_falls_back_to_single_fetch(self, email_client, mock_imap):
+        """Test UIDs missing from the bulk fetch are fetched one at a time."""
+        mock_imap.select = AsyncMock()
+        mock_imap.uid_search = AsyncMock(return_value=(None, [b"1 2"]))
+        raw_email = b"Subject: Test Subject\r\n\r\n" + b"x" * 100
+
+        def uid_side_effect(command, uid_set, fetch_format):
+            if uid_set == "2,1":
+                # Bulk response only contains UID 2
+                return (None, [b"1 FETCH (UID 2 BODY[] {%d}" % len(raw_email), bytearray(raw_email), b")"])
+            return (None, [b"1 FETCH (UID 1 RFC822 {%d}" % len(raw_email), bytearray(raw_email), b")"])
+
+        mock_imap.uid = AsyncMock(side_effect=uid_side_effect)
+
+        with patch.object(email_client, "imap_class", return_value=mock_imap):
+            emails = [email_data async for email_data in email_client.get_emails_stream(page=1, page_size=10)]
+
+            assert [email_data["uid"] for email_data in emails] == ["2", "1"]
+            mock_imap.uid.assert_any_call("fetch", "2,1", "(UID BODY.PEEK[])")
+            mock_imap.uid.assert_any_call("fetch", "1", "RFC822")
 
     @pytest.mark.asyncio
-    async def test_get_email_count(self, email_client):
+    async def test_get_emails_stream_fetches_batches_concurrently(self, email_server, make_mock_imap):
+        """Test later fetch batches run on further pooled connections and keep the page order."""
+        email_client = EmailClient(email_server, bulk_batch_size=2)
+        raw_email = b"Subject: Test Subject\r\n\r\nBody"
+
+        def uid_side_effect(command, uid_set, fetch_format):
+            response = []
+            for seq, uid in enumerate(uid_set.split(","), start=1):
+                response += [
+                    b"%d FETCH (UID %s BODY[] {%d}" % (seq, uid.encode(), len(raw_email)),
+                    bytearray(raw_email),
+                    b")",
+                ]
+            return (None, response)
+
+        connections = [make_mock_imap() for _ in range(3)]
+        for connection in connections:
+            connection.select = AsyncMock()
+            connection.uid_search = AsyncMock(return_value=(None, [b"1 2 3 4 5"]))
+            connection.uid = AsyncMock(side_effect=uid_side_effect)
+
+        with patch.object(email_client, "imap_class", side_effect=connections):
+            emails = [email_data async for email_data in email_client.get_emails_stream(page=1, page_size=10)]
+
+            assert [email_data["uid"] for email_data in emails] == ["5", "4", "3", "2", "1"]
+            connections[0].uid.assert_called_once_with("fetch", "5,4", "(UID BODY.PEEK[])")
+            fetched = {call.args[1] for connection in connections[1:] for call in connection.uid.call_args_list}
+            assert fetched == {"3,2", "1"}
+            connections[1].select.assert_called_with("INBOX")
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "login",
+        [
+            AsyncMock(return_value=("NO", [b"[LIMIT] Too many simultaneous connections"])),
+            AsyncMock(side_effect=aioimaplib.Abort("connection lost")),
+        ],
+    )
+    async def test_get_emails_stream_extra_connection_rejected(self, email_server, make_mock_imap, login):
+        """Test all batches run on the held connection when the server refuses another session."""
+        email_client = EmailClient(email_server, bulk_batch_size=2)
+        raw_email = b"Subject: Test Subject\r\n\r\nBody"
+
+        def uid_side_effect(command, uid_set, fetch_format):
+            response = []
+            for seq, uid in enumerate(uid_set.split(","), start=1):
+                response += [
+                    b"%d FETCH (UID %s BODY[] {%d}" % (seq, uid.encode(), len(raw_email)),
+                    bytearray(raw_email),
+                    b")",
+                ]
+            return (None, response)
+
+        connection = make_mock_imap()
+        connection.select = AsyncMock()
+        connection.uid_search = AsyncMock(return_value=(None, [b"1 2 3 4"]))
+        connection.uid = AsyncMock(side_effect=uid_side_effect)
+        rejected = make_mock_imap()
+        rejected.login = login
+
+        with patch.object(email_client, "imap_class", side_effect=[connection, rejected]):
+            emails = [email_data async for email_data in email_client.get_emails_stream(page=1, page_size=4)]
+
+            assert [email_data["uid"] for email_data in emails] == ["4", "3", "2", "1"]
+            fetched = [call.args[1] for call in connection.uid.call_args_list]
+            assert fetched == ["4,3", "2,1"]
+            rejected.logout.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_get_emails_stream_concurrent_pages_do_not_deadlock(self, email_server, make_mock_imap):
+        """Test concurrent multi-batch pages never wait for a connection while holding one."""
+        email_client = EmailClient(email_server, bulk_batch_size=2)
+        raw_email = b"Subject: Test Subject\r\n\r\nBody"
+
+        async def uid_side_effect(command, uid_set, fetch_format):
+            await asyncio.sleep(0)
+            response = []
+            for seq, uid in enumerate(uid_set.split(","), start=1):
+                response += [
+                    b"%d FETCH (UID %s BODY[] {%d}" % (seq, uid.encode(), len(raw_email)),
+                    bytearray(raw_email),
+                    b")",
+                ]
+            return (None, response)
+
+        async def uid_search(*criteria):
+            await asyncio.sleep(0)
+            return (None, [b"1 2 3 4"])
+
+        def imap_class(host, port):
+            connection = make_mock_imap()
+            connection.select = AsyncMock()
+            connection.uid_search = AsyncMock(side_effect=uid_search)
+            connection.uid = AsyncMock(side_effect=uid_side_effect)
+            return connection
+
+        async def read_page():
+            return [email_data["uid"] async for email_data in email_client.get_emails_stream(page=1, page_size=4)]
+
+        with patch.object(email_client, "imap_class", side_effect=imap_class):
+            pages = await asyncio.wait_for(asyncio.gather(*(read_page() for _ in range(3))), 5)
+
+            assert pages == [["4", "3", "2", "1"]] * 3
+
+    def test_parse_fetch_response(self):
+        """Test mapping UIDs to message literals, with the UID before or after the literal."""
+        lines = [
+            b"1 FETCH (UID 7 BODY[] {5}",
+            bytearray(b"first"),
+            b")",
+            b"2 FETCH (BODY[] {6}",
+            bytearray(b"second"),
+            b" UID 9)",
+            b"Fetch completed.",
+        ]
+
+        assert _parse_fetch_response(lines) == {"7": b"first", "9": b"second"}
+
+    @pytest.mark.asyncio
+    async def test_get_email_count(self, email_client, mock_imap):
         """Test getting email count."""
-        # Mock IMAP client
-        mock_imap = AsyncMock()
-        mock_imap._client_task = asyncio.Future()
-        mock_imap._client_task.set_result(None)
-        mock_imap.wait_hello_from_server = AsyncMock()
-        mock_imap.login = AsyncMock()
         mock_imap.select = AsyncMock()
         mock_imap.search = AsyncMock(return_value=(None, [b"1 2 3 4 5"]))
         mock_imap.uid_search = AsyncMock(return_value=(None, [b"1 2 3 4 5"]))
-        mock_imap.logout = AsyncMock()
 
         # Mock IMAP class
         with patch.object(email_client, "imap_class", return_value=mock_imap):
@@ -220,7 +399,100 @@ This is the email body."""
             )
             mock_imap.select.assert_called_once_with("INBOX")
             mock_imap.uid_search.assert_called_once_with("ALL")
-            mock_imap.logout.assert_called_once()
+            mock_imap.logout.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_wait_for_events(self, email_client, mock_imap):
+        """Test waiting for IDLE notifications."""
+        mock_imap.select = AsyncMock()
+        idle_task = asyncio.Future()
+        idle_task.set_result(None)
+        mock_imap.idle_start = AsyncMock(return_value=idle_task)
+        mock_imap.wait_server_push = AsyncMock(return_value=[b"4 EXISTS", b"1 RECENT", b"2 EXPUNGE"])
+        mock_imap.idle_done = MagicMock()
+
+        with patch.object(email_client, "imap_class", return_value=mock_imap):
+            events = await email_client.wait_for_events()
+
+            assert [(event.type, event.number) for event in events] == [("exists", 4), ("expunge", 2)]
+            mock_imap.select.assert_called_once_with("INBOX")
+            mock_imap.idle_start.assert_called_once_with(timeout=EVENTS_WAIT_TIMEOUT)
+            mock_imap.idle_done.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_wait_for_events_drains_queued_pushes(self, email_client, mock_imap):
+        """Test pushes queued behind the first one are reported now, not by the next IDLE."""
+        mock_imap.select = AsyncMock()
+        idle_task = asyncio.Future()
+        idle_task.set_result(None)
+        mock_imap.idle_start = AsyncMock(return_value=idle_task)
+        idle_queue = mock_imap.protocol.idle_queue
+        idle_queue.put_nowait([b"5 EXISTS"])
+        idle_queue.put_nowait([b"1 RECENT", b"3 EXPUNGE"])
+        mock_imap.wait_server_push = AsyncMock(side_effect=lambda timeout: idle_queue.get_nowait())
+        mock_imap.idle_done = MagicMock()
+
+        with patch.object(email_client, "imap_class", return_value=mock_imap):
+            events = await email_client.wait_for_events()
+
+            assert [(event.type, event.number) for event in events] == [("exists", 5), ("expunge", 3)]
+            assert idle_queue.empty()
+
+    @pytest.mark.asyncio
+    async def test_wait_for_events_timeout(self, email_client, mock_imap):
+        """Test IDLE ending without notifications."""
+        mock_imap.select = AsyncMock()
+        idle_task = asyncio.Future()
+        idle_task.set_result(None)
+        mock_imap.idle_start = AsyncMock(return_value=idle_task)
+        mock_imap.wait_server_push = AsyncMock(return_value=aioimaplib.STOP_WAIT_SERVER_PUSH)
+        mock_imap.idle_done = MagicMock()
+
+        with patch.object(email_client, "imap_class", return_value=mock_imap):
+            assert await email_client.wait_for_events() == []
+            mock_imap.idle_done.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_watch(self, email_client, mock_imap):
+        """Test watching a folder yields IDLE notifications."""
+        mock_imap.select = AsyncMock()
+        idle_task = asyncio.Future()
+        idle_task.set_result(None)
+        mock_imap.idle_start = AsyncMock(return_value=idle_task)
+        mock_imap.wait_server_push = AsyncMock(side_effect=[aioimaplib.STOP_WAIT_SERVER_PUSH, [b"5 EXISTS"]])
+        mock_imap.idle_done = MagicMock()
+
+        with patch.object(email_client, "imap_class", return_value=mock_imap):
+            watcher = email_client.watch("Archive")
+            event = await anext(watcher)
+            await watcher.aclose()
+
+            assert (event.type, event.number) == ("exists", 5)
+            mock_imap.select.assert_called_once_with("Archive")
+            assert mock_imap.idle_start.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_emails_incremental(self, email_client, mock_imap):
+        """Test incremental fetching only searches UIDs above the last seen one after new mail arrives."""
+        mock_imap.select = AsyncMock()
+        # "11:*" matches the highest existing UID 10 when there is no new mail
+        mock_imap.uid_search = AsyncMock(side_effect=[(None, [b"10"]), (None, [b"11"])])
+        idle_task = asyncio.Future()
+        idle_task.set_result(None)
+        mock_imap.idle_start = AsyncMock(return_value=idle_task)
+        mock_imap.wait_server_push = AsyncMock(return_value=[b"11 EXISTS"])
+        mock_imap.idle_done = MagicMock()
+
+        with patch.object(email_client, "imap_class", return_value=mock_imap):
+            with patch.object(email_client, "_fetch_uid_set", return_value={"11": b"raw"}):
+                with patch.object(email_client, "_parse_email_data", return_value={"subject": "New"}):
+                    stream = email_client.get_emails_incremental(since_uid=10)
+                    email_data = await anext(stream)
+                    await stream.aclose()
+
+                    assert email_data == {"subject": "New", "uid": "11"}
+                    mock_imap.uid_search.assert_any_call("UID", "11:*")
+                    mock_imap.idle_start.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_send_email(self, email_client):
@@ -262,3 +534,69 @@ This is the email body."""
             assert "recipient@example.com" in recipients
             assert "cc@example.com" in recipients
             assert "bcc@example.com" in recipients
+
+    @pytest.mark.asyncio
+    async def test_send_email_reuses_connection(self, email_client):
+        """Test consecutive sends share one logged-in SMTP connection."""
+        mock_smtp = AsyncMock()
+        mock_smtp.is_connected = True
+
+        with patch("aiosmtplib.SMTP", return_value=mock_smtp) as mock_smtp_class:
+            await email_client.send_email(["a@example.com"], "First", "Body")
+            await email_client.send_email(["b@example.com"], "Second", "Body")
+
+            mock_smtp_class.assert_called_once()
+            mock_smtp.connect.assert_called_once()
+            mock_smtp.login.assert_called_once()
+            assert mock_smtp.send_message.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_smtp_keepalive(self, email_client, monkeypatch):
+        """Test an idle SMTP connection is kept open with NOOP until closed."""
+        monkeypatch.setattr("mcp_email_server.emails.classic.SMTP_KEEPALIVE_INTERVAL", 0)
+        mock_smtp = AsyncMock()
+        mock_smtp.is_connected = True
+
+        with patch("aiosmtplib.SMTP", return_value=mock_smtp):
+            await email_client.connect_smtp()
+            keepalive_task = email_client._smtp_keepalive_task
+            for _ in range(3):
+                await asyncio.sleep(0)
+
+            mock_smtp.noop.assert_called()
+
+            await close_smtp_connections()
+            await asyncio.sleep(0)
+
+            mock_smtp.quit.assert_called_once()
+            assert keepalive_task.cancelled()
+            assert email_client._smtp is None
+
+    @pytest.mark.asyncio
+    async def test_smtp_keepalive_failure_drops_connection(self, email_client, monkeypatch):
+        """Test a failed keepalive NOOP drops the connection so the next send reconnects."""
+        monkeypatch.setattr("mcp_email_server.emails.classic.SMTP_KEEPALIVE_INTERVAL", 0)
+        mock_smtp = AsyncMock()
+        mock_smtp.is_connected = True
+        mock_smtp.noop = AsyncMock(side_effect=ConnectionError("Connection lost"))
+
+        with patch("aiosmtplib.SMTP", return_value=mock_smtp):
+            await email_client.connect_smtp()
+            await email_client._smtp_keepalive_task
+
+            mock_smtp.quit.assert_called_once()
+            assert email_client._smtp is None
+
+    @pytest.mark.asyncio
+    async def test_send_email_drops_connection_on_error(self, email_client):
+        """Test a failed send closes the connection so the next send reconnects."""
+        mock_smtp = AsyncMock()
+        mock_smtp.is_connected = True
+        mock_smtp.send_message = AsyncMock(side_effect=ConnectionError("Connection lost"))
+
+        with patch("aiosmtplib.SMTP", return_value=mock_smtp):
+            with pytest.raises(ConnectionError):
+                await email_client.send_email(["a@example.com"], "Subject", "Body")
+
+            mock_smtp.quit.assert_called_once()
+            assert email_client._smtp is None
@@ -1,9 +1,11 @@
 """Test email move/copy operations."""
 import asyncio
 from datetime import datetime
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, call, patch
 
+import aioimaplib
 import pytest
+from aioimaplib import Response
 
 from mcp_email_server.config import EmailServer, EmailSettings
 from mcp_email_server.emails.classic import ClassicEmailHandler, EmailClient
@@ -45,20 +47,13 @@ def classic_handler(email_settings):
 
 class TestEmailClientFolderOperations:
     @pytest.mark.asyncio
-    async def test_list_folders(self, email_client):
+    async def test_list_folders(self, email_client, mock_imap):
         """Test listing folders."""
-        # Mock IMAP client
-        mock_imap = AsyncMock()
-        mock_imap._client_task = asyncio.Future()
-        mock_imap._client_task.set_result(None)
-        mock_imap.wait_hello_from_server = AsyncMock()
-        mock_imap.login = AsyncMock()
         mock_imap.list = AsyncMock(return_value=(None, [
             b'(\\HasNoChildren) "." "INBOX"',
             b'(\\HasNoChildren) "." "INBOX.Sent"',
             b'(\\HasNoChildren) "." "INBOX.Drafts"',
         ]))
-        mock_imap.logout = AsyncMock()
 
         with patch.object(email_client, "imap_class", return_value=mock_imap):
             folders = await email_client.list_folders()
@@ -73,19 +68,207 @@ class TestEmailClientFolderOperations:
                 email_client.email_server.user_name, email_client.email_server.password
             )
             mock_imap.list.assert_called_once_with("", "*")
-            mock_imap.logout.assert_called_once()
+            mock_imap.logout.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_create_folder(self, email_client):
+    async def test_list_folders_parsing(self, email_client, mock_imap):
+        """Test parsing multiple flags, unquoted names and non-folder lines."""
+        mock_imap.list = AsyncMock(
+            return_value=(
+                None,
+                [
+                    b'(\\HasChildren \\Marked) "/" INBOX',
+                    bytearray(b'(\\HasNoChildren) "/" "Literal"'),
+                    b'(\\HasNoChildren \\Sent) "/" "Sent Items"',
+                    b"LIST completed.",
+                ],
+            )
+        )
+
+        with patch.object(email_client, "imap_class", return_value=mock_imap):
+            folders = await email_client.list_folders()
+
+            assert folders == [
+                FolderInfo(name="INBOX", delimiter="/", flags=["HasChildren", "Marked"]),
+                FolderInfo(name="Sent Items", delimiter="/", flags=["HasNoChildren", "Sent"]),
+            ]
+
+    @staticmethod
+    def _serve(mock_imap, response: bytes) -> asyncio.Task:
+        """Answer the next command sent over a real aioimaplib protocol with response, tagged."""
+        protocol = aioimaplib.IMAP4ClientProtocol(asyncio.get_running_loop())
+        protocol.transport = MagicMock()
+        protocol.state = aioimaplib.AUTH
+        mock_imap.protocol = protocol
+        mock_imap.timeout = 10
+        return asyncio.create_task(TestEmailClientFolderOperations._answer(protocol, response))
+
+    @staticmethod
+    async def _answer(protocol, response: bytes) -> bytes:
+        while not protocol.transport.write.called:
+            await asyncio.sleep(0)
+        sent = protocol.transport.write.call_args[0][0]
+        protocol.data_received(response.replace(b"TAG", sent.split()[0]))
+        return sent
+
+    @pytest.mark.asyncio
+    async def test_list_folders_with_counts_list_status(self, email_client, mock_imap):
+        """Test counts come from a single LIST-STATUS command when supported."""
+        mock_imap.has_capability = MagicMock(side_effect=lambda capability: capability == "LIST-STATUS")
+        server = self._serve(
+            mock_imap,
+            (
+                b'* LIST (\\HasNoChildren) "/" "INBOX"\r\n'
+                b'* STATUS "INBOX" (MESSAGES 17 UNSEEN 3)\r\n'
+                b'* LIST (\\Noselect \\HasChildren) "/" "Archive"\r\n'
+                b'* LIST (\\HasNoChildren) "/" "Sent Items"\r\n'
+                b'* STATUS "Sent Items" (MESSAGES 5 UNSEEN 0)\r\n'
+                b"TAG OK LIST completed\r\n"
+            ),
+        )
+
+        with patch.object(email_client, "imap_class", return_value=mock_imap):
+            folders = await email_client.list_folders(with_counts=True)
+
+            assert [(folder.name, folder.total, folder.unseen) for folder in folders] == [
+                ("INBOX", 17, 3),
+                ("Archive", None, None),
+                ("Sent Items", 5, 0),
+            ]
+            assert (await server).endswith(b' LIST "" * RETURN (STATUS (MESSAGES UNSEEN))\r\n')
+            assert mock_imap.protocol.pending_async_commands == {}
+            mock_imap.list.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_list_folders_with_counts_list_status_rejected(self, email_client, mock_imap):
+        """Test a rejected LIST-STATUS falls back to LIST and STATUS."""
+        mock_imap.has_capability = MagicMock(side_effect=lambda capability: capability == "LIST-STATUS")
+        mock_imap.list = AsyncMock(return_value=("OK", [b'(\\HasNoChildren) "/" "INBOX"', b"LIST completed."]))
+        mock_imap.status = AsyncMock(return_value=("OK", [b'"INBOX" (MESSAGES 17 UNSEEN 3)', b"STATUS completed."]))
+        server = self._serve(mock_imap, b"TAG BAD Unknown LIST option\r\n")
+
+        with patch.object(email_client, "imap_class", return_value=mock_imap):
+            folders = await email_client.list_folders(with_counts=True)
+            await server
+
+            assert [(folder.name, folder.total, folder.unseen) for folder in folders] == [("INBOX", 17, 3)]
+            mock_imap.list.assert_called_once_with("", "*")
+
+    @pytest.mark.asyncio
+    async def test_list_folders_with_counts_list_status_internals_missing(self, email_client, mock_imap):
+        """Test LIST-STATUS falls back to LIST and STATUS if aioimaplib's protocol internals changed."""
+        mock_imap.has_capability = MagicMock(side_effect=lambda capability: capability == "LIST-STATUS")
+        mock_imap.protocol = object()
+        mock_imap.list = AsyncMock(return_value=("OK", [b'(\\HasNoChildren) "/" "INBOX"', b"LIST completed."]))
+        mock_imap.status = AsyncMock(return_value=("OK", [b'"INBOX" (MESSAGES 17 UNSEEN 3)', b"STATUS completed."]))
+
+        with patch.object(email_client, "imap_class", return_value=mock_imap):
+            folders = await email_client.list_folders(with_counts=True)
+
+            assert [(folder.name, folder.total, folder.unseen) for folder in folders] == [("INBOX", 17, 3)]
+            mock_imap.list.assert_called_once_with("", "*")
+
+    @pytest.mark.asyncio
+    async def test_list_folders_with_counts_status_fallback(self, email_client, mock_imap):
+        """Test counts fall back to one STATUS per selectable folder without LIST-STATUS."""
+        mock_imap.list = AsyncMock(
+            return_value=(
+                None,
+                [
+                    b'(\\HasNoChildren) "/" "INBOX"',
+                    b'(\\NoSelect \\HasChildren) "/" "Archive"',
+                    b'(\\HasNoChildren) "/" "Sent Items"',
+                ],
+            )
+        )
+        mock_imap.status = AsyncMock(
+            side_effect=[
+                ("OK", [b'"INBOX" (MESSAGES 17 UNSEEN 3)', b"STATUS completed."]),
+                ("OK", [b'"Sent Items" (MESSAGES 5 UNSEEN 0)', b"STATUS completed."]),
+            ]
+        )
+
+        with patch.object(email_client, "imap_class", return_value=mock_imap):
+            folders = await email_client.list_folders(with_counts=True)
+
+            assert [(folder.name, folder.total, folder.unseen) for folder in folders] == [
+                ("INBOX", 17, 3),
+                ("Archive", None, None),
+                ("Sent Items", 5, 0),
+            ]
+            mock_imap.status.assert_any_call('"INBOX"', "(MESSAGES UNSEEN)")
+            mock_imap.status.assert_any_call('"Sent Items"', "(MESSAGES UNSEEN)")
+            assert mock_imap.status.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_list_folders_cached_until_create_folder(self, email_client, mock_imap):
+        """Test folder listings are cached and invalidated by create_folder."""
+        mock_imap.list = AsyncMock(return_value=(None, [b'(\\HasNoChildren) "." "INBOX"']))
+        mock_imap.create = AsyncMock(return_value=("OK", [b"CREATE completed"]))
+
+        with patch.object(email_client, "imap_class", return_value=mock_imap):
+            first = await email_client.list_folders()
+            second = await email_client.list_folders()
+
+            assert first == second
+            mock_imap.list.assert_called_once()
+
+            await email_client.create_folder("Archive")
+            await email_client.list_folders()
+
+            assert mock_imap.list.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_list_folders_cached_during_create_folder_is_invalidated(self, email_client, mock_imap):
+        """Test a listing cached while create_folder runs is dropped once the folder exists."""
+
+        async def create(folder_name):
+            # A concurrent listing caches the folders before the new one exists
+            await email_client.list_folders()
+            return ("OK", [b"CREATE completed"])
+
+        mock_imap.list = AsyncMock(return_value=(None, [b'(\\HasNoChildren) "." "INBOX"']))
+        mock_imap.create = AsyncMock(side_effect=create)
+
+        with patch.object(email_client, "imap_class", return_value=mock_imap):
+            await email_client.create_folder("Archive")
+            await email_client.list_folders()
+
+            assert mock_imap.list.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_list_folders_answered_before_create_folder_is_not_cached(self, email_client, make_mock_imap):
+        """Test a listing answered before create_folder but finishing after it is not cached."""
+        answered = asyncio.Event()
+        release = asyncio.Event()
+        listings = [[b'(\\HasNoChildren) "." "INBOX"'], [b'(\\HasNoChildren) "." "Archive"']]
+
+        async def list_side_effect(reference, pattern):
+            listing = listings.pop(0)
+            answered.set()
+            await release.wait()
+            return (None, listing)
+
+        connections = [make_mock_imap(), make_mock_imap()]
+        for connection in connections:
+            connection.list = AsyncMock(side_effect=list_side_effect)
+            connection.create = AsyncMock(return_value=("OK", [b"CREATE completed"]))
+
+        with patch.object(email_client, "imap_class", side_effect=connections):
+            listing = asyncio.create_task(email_client.list_folders())
+            await answered.wait()
+            await email_client.create_folder("Archive")
+            release.set()
+            await listing
+
+            folders = await email_client.list_folders()
+
+            assert [folder.name for folder in folders] == ["Archive"]
+
+    @pytest.mark.asyncio
+    async def test_create_folder(self, email_client, mock_imap):
         """Test creating a folder."""
-        # Mock IMAP client
-        mock_imap = AsyncMock()
-        mock_imap._client_task = asyncio.Future()
-        mock_imap._client_task.set_result(None)
-        mock_imap.wait_hello_from_server = AsyncMock()
-        mock_imap.login = AsyncMock()
-        mock_imap.create = AsyncMock(return_value=(None, [b'OK']))
-        mock_imap.logout = AsyncMock()
+        mock_imap.create = AsyncMock(return_value=("OK", [b"CREATE completed"]))
 
         with patch.object(email_client, "imap_class", return_value=mock_imap):
             result = await email_client.create_folder("Test Folder")
@@ -95,19 +278,12 @@ class TestEmailClientFolderOperations:
                 email_client.email_server.user_name, email_client.email_server.password
             )
             mock_imap.create.assert_called_once_with("Test Folder")
-            mock_imap.logout.assert_called_once()
+            mock_imap.logout.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_create_folder_failure(self, email_client):
+    async def test_create_folder_failure(self, email_client, mock_imap):
         """Test creating a folder that fails."""
-        # Mock IMAP client
-        mock_imap = AsyncMock()
-        mock_imap._client_task = asyncio.Future()
-        mock_imap._client_task.set_result(None)
-        mock_imap.wait_hello_from_server = AsyncMock()
-        mock_imap.login = AsyncMock()
-        mock_imap.create = AsyncMock(return_value=(None, [b'NO']))
-        mock_imap.logout = AsyncMock()
+        mock_imap.create = AsyncMock(return_value=("NO", [b"[CANNOT] Invalid mailbox name"]))
 
         with patch.object(email_client, "imap_class", return_value=mock_imap):
             result = await email_client.create_folder("Invalid/Folder")
@@ -115,17 +291,10 @@ class TestEmailClientFolderOperations:
             assert result is False
 
     @pytest.mark.asyncio
-    async def test_copy_emails(self, email_client):
+    async def test_copy_emails(self, email_client, mock_imap):
         """Test copying emails."""
-        # Mock IMAP client
-        mock_imap = AsyncMock()
-        mock_imap._client_task = asyncio.Future()
-        mock_imap._client_task.set_result(None)
-        mock_imap.wait_hello_from_server = AsyncMock()
-        mock_imap.login = AsyncMock()
         mock_imap.select = AsyncMock()
-        mock_imap.uid = AsyncMock(return_value=(None, [b'OK']))
-        mock_imap.logout = AsyncMock()
+        mock_imap.uid = AsyncMock(return_value=Response("OK", [b"[COPYUID 38505 123,456 1:2] COPY completed"]))
 
         with patch.object(email_client, "imap_class", return_value=mock_imap):
             result = await email_client.copy_emails(["123", "456"], "Archive")
@@ -139,25 +308,21 @@ class TestEmailClientFolderOperations:
 
             mock_imap.login.assert_called_once()
             mock_imap.select.assert_called_once_with("INBOX")
-            assert mock_imap.uid.call_count == 2
-            mock_imap.logout.assert_called_once()
+            mock_imap.uid.assert_called_once_with("copy", "123,456", "Archive")
+            mock_imap.logout.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_copy_emails_partial_failure(self, email_client):
+    async def test_copy_emails_partial_failure(self, email_client, mock_imap):
         """Test copying emails with some failures."""
-        # Mock IMAP client
-        mock_imap = AsyncMock()
-        mock_imap._client_task = asyncio.Future()
-        mock_imap._client_task.set_result(None)
-        mock_imap.wait_hello_from_server = AsyncMock()
-        mock_imap.login = AsyncMock()
         mock_imap.select = AsyncMock()
-        # First UID succeeds, second fails
-        mock_imap.uid = AsyncMock(side_effect=[
-            (None, [b'OK']),
-            (None, [b'NO'])
-        ])
-        mock_imap.logout = AsyncMock()
+        # Bulk copy is rejected, then first UID succeeds and second fails
+        mock_imap.uid = AsyncMock(
+            side_effect=[
+                ("NO", [b"UID command failed"]),
+                ("OK", [b"UID command completed"]),
+                ("NO", [b"UID command failed"]),
+            ]
+        )
 
         with patch.object(email_client, "imap_class", return_value=mock_imap):
             result = await email_client.copy_emails(["123", "456"], "Archive")
@@ -168,19 +333,34 @@ class TestEmailClientFolderOperations:
             assert result.failed_uids == ["456"]
             assert "1 failed" in result.message
 
+            mock_imap.uid.assert_any_call("copy", "123,456", "Archive")
+            mock_imap.uid.assert_any_call("copy", "123", "Archive")
+            mock_imap.uid.assert_any_call("copy", "456", "Archive")
+
     @pytest.mark.asyncio
-    async def test_move_emails_with_move_command(self, email_client):
+    async def test_copy_emails_in_batches(self, email_settings, mock_imap):
+        """Test copying emails splits large UID sets into batches."""
+        email_client = EmailClient(email_settings.incoming, bulk_batch_size=2)
+
+        mock_imap.select = AsyncMock()
+        mock_imap.uid = AsyncMock(return_value=("OK", [b"UID command completed"]))
+
+        with patch.object(email_client, "imap_class", return_value=mock_imap):
+            result = await email_client.copy_emails(["1", "2", "3", "4", "5"], "Archive")
+
+            assert result.success is True
+            assert result.copied_count == 5
+            assert mock_imap.uid.call_count == 3
+            mock_imap.uid.assert_any_call("copy", "1,2", "Archive")
+            mock_imap.uid.assert_any_call("copy", "3,4", "Archive")
+            mock_imap.uid.assert_any_call("copy", "5", "Archive")
+
+    @pytest.mark.asyncio
+    async def test_move_emails_with_move_command(self, email_client, mock_imap):
         """Test moving emails using MOVE command."""
-        # Mock IMAP client
-        mock_imap = AsyncMock()
-        mock_imap._client_task = asyncio.Future()
-        mock_imap._client_task.set_result(None)
-        mock_imap.wait_hello_from_server = AsyncMock()
-        mock_imap.login = AsyncMock()
         mock_imap.select = AsyncMock()
-        mock_imap.uid = AsyncMock(return_value=(None, [b'OK']))
+        mock_imap.uid = AsyncMock(return_value=("OK", [b"UID command completed"]))
         mock_imap.expunge = AsyncMock()
-        mock_imap.logout = AsyncMock()
 
         with patch.object(email_client, "imap_class", return_value=mock_imap):
             result = await email_client.move_emails(["123", "456"], "Archive")
@@ -192,51 +372,128 @@ class TestEmailClientFolderOperations:
             assert len(result.failed_uids) == 0
             assert "Successfully moved 2 emails" in result.message
 
-            # Should use MOVE command
-            mock_imap.uid.assert_any_call('move', '123', 'Archive')
-            mock_imap.uid.assert_any_call('move', '456', 'Archive')
-            mock_imap.expunge.assert_called_once()
+            # Should use a single MOVE command for the whole sequence-set, which needs no EXPUNGE
+            mock_imap.uid.assert_called_once_with("move", "123,456", "Archive")
+            mock_imap.expunge.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_move_emails_fallback_to_copy_delete(self, email_client):
+    async def test_move_emails_fallback_to_copy_delete(self, email_client, mock_imap):
         """Test moving emails with fallback to COPY+DELETE."""
-        # Mock IMAP client
-        mock_imap = AsyncMock()
-        mock_imap._client_task = asyncio.Future()
-        mock_imap._client_task.set_result(None)
-        mock_imap.wait_hello_from_server = AsyncMock()
-        mock_imap.login = AsyncMock()
         mock_imap.select = AsyncMock()
 
         # MOVE command fails, so it falls back to COPY+STORE
         def uid_side_effect(command, uid, *args):
             if command == 'move':
                 raise ValueError("MOVE not supported")
-            elif command == 'copy' or command == 'store':
-                return (None, [b'OK'])
-            return (None, [b'OK'])
+            return ("OK", [b"UID command completed"])
+
+        mock_imap.uid = AsyncMock(side_effect=uid_side_effect)
+        mock_imap.expunge = AsyncMock()
+
+        with patch.object(email_client, "imap_class", return_value=mock_imap):
+            result = await email_client.move_emails(["123", "456"], "Archive")
+
+            assert isinstance(result, EmailOperationResult)
+            assert result.success is True
+            assert result.moved_count == 2
+
+            mock_imap.uid.assert_any_call("copy", "123,456", "Archive")
+            mock_imap.uid.assert_any_call("store", "123,456", "+FLAGS.SILENT", "\\Deleted")
+            mock_imap.expunge.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_move_emails_fallback_uid_expunge(self, email_client, mock_imap):
+        """Test the COPY+DELETE fallback expunges only the moved UIDs with UIDPLUS."""
+        mock_imap.select = AsyncMock()
+        mock_imap.has_capability = MagicMock(side_effect=lambda capability: capability == "UIDPLUS")
+
+        def uid_side_effect(command, uid, *args):
+            if command == "move":
+                raise ValueError("MOVE not supported")
+            return ("OK", [b"UID command completed"])
+
+        mock_imap.uid = AsyncMock(side_effect=uid_side_effect)
+        mock_imap.expunge = AsyncMock()
+
+        with patch.object(email_client, "imap_class", return_value=mock_imap):
+            result = await email_client.move_emails(["123", "456"], "Archive")
+
+            assert result.success is True
+            assert result.moved_count == 2
+
+            mock_imap.uid.assert_any_call("store", "123,456", "+FLAGS.SILENT", "\\Deleted")
+            mock_imap.uid.assert_any_call("expunge", "123,456")
+            mock_imap.expunge.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_move_emails_fallback_retries_store_without_copying_again(self, email_client, mock_imap):
+        """Test a failed STORE after a successful COPY is retried alone, never copying twice."""
+        mock_imap.select = AsyncMock()
+        store_results = iter([("NO", [b"STORE failed"]), ("OK", [b"STORE completed"])])
+
+        def uid_side_effect(command, uid, *args):
+            if command == "move":
+                return ("NO", [b"MOVE not supported"])
+            if command == "store":
+                return next(store_results)
+            return ("OK", [b"UID command completed"])
 
         mock_imap.uid = AsyncMock(side_effect=uid_side_effect)
+
+        with patch.object(email_client, "imap_class", return_value=mock_imap):
+            result = await email_client.move_emails(["123", "456"], "Archive")
+
+            assert result.success is True
+            assert result.moved_count == 2
+            copies = [call for call in mock_imap.uid.call_args_list if call.args[0] == "copy"]
+            assert copies == [call("copy", "123,456", "Archive")]
+            assert mock_imap.uid.call_args_list.count(call("store", "123,456", "+FLAGS.SILENT", "\\Deleted")) == 2
+
+    @pytest.mark.asyncio
+    async def test_move_emails_fallback_store_failure_reports_batch(self, email_client, mock_imap):
+        """Test copied emails that cannot be deleted are reported as failed, not moved one by one."""
+        mock_imap.select = AsyncMock()
+
+        def uid_side_effect(command, uid, *args):
+            if command in ("move", "store"):
+                return ("NO", [b"UID command failed"])
+            return ("OK", [b"UID command completed"])
+
+        mock_imap.uid = AsyncMock(side_effect=uid_side_effect)
+
+        with patch.object(email_client, "imap_class", return_value=mock_imap):
+            with patch.object(email_client, "_move_single_email") as mock_move:
+                result = await email_client.move_emails(["123", "456"], "Archive")
+
+                assert result.success is False
+                assert result.moved_count == 0
+                assert result.failed_uids == ["123", "456"]
+                mock_move.assert_not_called()
+                mock_imap.uid.assert_any_call("copy", "123,456", "Archive")
+
+    @pytest.mark.asyncio
+    async def test_move_emails_bulk_rejected_falls_back_to_single(self, email_client, mock_imap):
+        """Test moving emails one UID at a time when the server rejects the bulk form."""
+        mock_imap.select = AsyncMock()
+        mock_imap.uid = AsyncMock(return_value=("NO", [b"UID command failed"]))
         mock_imap.expunge = AsyncMock()
-        mock_imap.logout = AsyncMock()
 
         with patch.object(email_client, "imap_class", return_value=mock_imap):
-            with patch.object(email_client, "_move_single_email", return_value=True) as mock_move:
-                result = await email_client.move_emails(["123"], "Archive")
+            with patch.object(email_client, "_move_single_email", side_effect=[True, False]) as mock_move:
+                result = await email_client.move_emails(["123", "456"], "Archive")
 
                 assert isinstance(result, EmailOperationResult)
-                assert result.success is True
+                assert result.success is False
                 assert result.moved_count == 1
+                assert result.failed_uids == ["456"]
 
-                # Should call the helper method
-                mock_move.assert_called_once_with(mock_imap, '123', 'Archive')
-                mock_imap.expunge.assert_called_once()
+                mock_move.assert_any_call(mock_imap, "123", "Archive")
+                mock_move.assert_any_call(mock_imap, "456", "Archive")
 
     @pytest.mark.asyncio
-    async def test_move_single_email_with_move_command(self, email_client):
+    async def test_move_single_email_with_move_command(self, email_client, mock_imap):
         """Test the _move_single_email helper method with MOVE command."""
-        mock_imap = AsyncMock()
-        mock_imap.uid = AsyncMock(return_value=(None, [b'OK']))
+        mock_imap.uid = AsyncMock(return_value=("OK", [b"UID command completed"]))
 
         result = await email_client._move_single_email(mock_imap, "123", "Archive")
 
@@ -244,16 +501,15 @@ class TestEmailClientFolderOperations:
         mock_imap.uid.assert_called_once_with('move', '123', 'Archive')
 
     @pytest.mark.asyncio
-    async def test_move_single_email_fallback_to_copy_delete(self, email_client):
+    async def test_move_single_email_fallback_to_copy_delete(self, email_client, mock_imap):
         """Test the _move_single_email helper method with fallback."""
-        mock_imap = AsyncMock()
 
         def uid_side_effect(command, uid, *args):
             if command == 'move':
                 raise ValueError("MOVE not supported")
             elif command == 'copy' or command == 'store':
-                return (None, [b'OK'])
-            return (None, [b'OK'])
+                return ("OK", [b"UID command completed"])
+            return ("OK", [b"UID command completed"])
 
         mock_imap.uid = AsyncMock(side_effect=uid_side_effect)
 
@@ -3,8 +3,15 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from mcp_email_server.app import copy_emails, create_folder, list_folders, move_emails
-from mcp_email_server.emails.models import EmailOperationResult, FolderInfo
+from mcp_email_server.app import (
+    copy_emails,
+    copy_emails_multi,
+    create_folder,
+    list_folders,
+    list_folders_all,
+    move_emails,
+)
+from mcp_email_server.emails.models import AccountFolders, EmailOperationResult, FolderInfo
 
 
 class TestMCPEmailOperations:
@@ -80,3 +87,78 @@ class TestMCPEmailOperations:
             assert result == expected_result
             mock_dispatch.assert_called_once_with("test_account")
             mock_handler.move_emails.assert_called_once_with(["123", "456"], "Archive")
+
+    @pytest.mark.asyncio
+    async def test_list_folders_all_mcp_tool(self):
+        """Test list_folders_all MCP tool."""
+        expected_folders = [FolderInfo(name="INBOX", delimiter=".", flags=["HasNoChildren"])]
+
+        with patch("mcp_email_server.app.dispatch_handler") as mock_dispatch:
+            ok_handler = AsyncMock()
+            ok_handler.list_folders.return_value = expected_folders
+            failing_handler = AsyncMock()
+            failing_handler.list_folders.side_effect = ConnectionError("Connection lost")
+            mock_dispatch.side_effect = [ok_handler, failing_handler]
+
+            result = await list_folders_all(["account_a", "account_b"])
+
+            assert result == [
+                AccountFolders(account_name="account_a", folders=expected_folders),
+                AccountFolders(account_name="account_b", error="Connection lost"),
+            ]
+            mock_dispatch.assert_any_call("account_a")
+            mock_dispatch.assert_any_call("account_b")
+
+    @pytest.mark.asyncio
+    async def test_list_folders_all_unknown_account(self):
+        """Test an account that cannot be dispatched is reported without failing the others."""
+        expected_folders = [FolderInfo(name="INBOX", delimiter=".", flags=["HasNoChildren"])]
+
+        with patch("mcp_email_server.app.dispatch_handler") as mock_dispatch:
+            ok_handler = AsyncMock()
+            ok_handler.list_folders.return_value = expected_folders
+            mock_dispatch.side_effect = [ok_handler, ValueError("Account missing not found")]
+
+            result = await list_folders_all(["account_a", "missing"])
+
+            assert result == [
+                AccountFolders(account_name="account_a", folders=expected_folders),
+                AccountFolders(account_name="missing", error="Account missing not found"),
+            ]
+
+    @pytest.mark.asyncio
+    async def test_copy_emails_multi_mcp_tool(self):
+        """Test copy_emails_multi MCP tool."""
+        expected_result = EmailOperationResult(success=True, message="Successfully copied 2 emails", copied_count=2)
+
+        with patch("mcp_email_server.app.dispatch_handler") as mock_dispatch:
+            ok_handler = AsyncMock()
+            ok_handler.copy_emails.return_value = expected_result
+            failing_handler = AsyncMock()
+            failing_handler.copy_emails.side_effect = ConnectionError("Connection lost")
+            mock_dispatch.side_effect = [ok_handler, failing_handler]
+
+            result = await copy_emails_multi({"account_a": ["123", "456"], "account_b": ["789"]}, "Archive")
+
+            assert result["account_a"] == expected_result
+            assert result["account_b"].success is False
+            assert result["account_b"].failed_uids == ["789"]
+            assert "Connection lost" in result["account_b"].message
+            ok_handler.copy_emails.assert_called_once_with(["123", "456"], "Archive")
+            failing_handler.copy_emails.assert_called_once_with(["789"], "Archive")
+
+    @pytest.mark.asyncio
+    async def test_copy_emails_multi_unknown_account(self):
+        """Test an account that cannot be dispatched is reported without failing the others."""
+        expected_result = EmailOperationResult(success=True, message="Successfully copied 1 emails", copied_count=1)
+
+        with patch("mcp_email_server.app.dispatch_handler") as mock_dispatch:
+            ok_handler = AsyncMock()
+            ok_handler.copy_emails.return_value = expected_result
+            mock_dispatch.side_effect = [ok_handler, NotImplementedError]
+
+            result = await copy_emails_multi({"account_a": ["123"], "provider": ["789"]}, "Archive")
+
+            assert result["account_a"] == expected_result
+            assert result["provider"].success is False
+            assert result["provider"].failed_uids == ["789"]
@@ -5,12 +5,14 @@ import pytest
 
 from mcp_email_server.app import (
     add_email_account,
+    get_inbox_events,
     list_available_accounts,
     page_email,
     send_email,
 )
 from mcp_email_server.config import EmailServer, EmailSettings, ProviderSettings
-from mcp_email_server.emails.models import EmailData, EmailPageResponse
+from mcp_email_server.emails.classic import ClassicEmailHandler
+from mcp_email_server.emails.models import EmailData, EmailPageResponse, MailboxEvent
 
 
 class TestMcpTools:
@@ -95,6 +97,22 @@ class TestMcpTools:
             mock_settings.add_email.assert_called_once_with(email_settings)
             mock_settings.store.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_add_email_account_closes_dropped_smtp_connections(self, email_settings):
+        """Test the SMTP sessions of the handlers dropped from the dispatcher cache are closed."""
+        handler = ClassicEmailHandler(email_settings)
+        mock_smtp = AsyncMock()
+        mock_smtp.is_connected = True
+
+        with patch("aiosmtplib.SMTP", return_value=mock_smtp):
+            await handler.outgoing_client.connect_smtp()
+
+        with patch("mcp_email_server.app.get_settings", return_value=MagicMock()):
+            await add_email_account(email_settings)
+
+            mock_smtp.quit.assert_called_once()
+            assert handler.outgoing_client._smtp_keepalive_task is None
+
     @pytest.mark.asyncio
     async def test_page_email(self):
         """Test page_email MCP tool."""
@@ -160,6 +178,7 @@ class TestMcpTools:
                 from_address="sender@example.com",
                 to_address=None,
                 order="desc",
+                layout="aos",
             )
 
     @pytest.mark.asyncio
@@ -187,3 +206,17 @@ class TestMcpTools:
                 ["cc@example.com"],
                 ["bcc@example.com"],
             )
+
+    @pytest.mark.asyncio
+    async def test_get_inbox_events(self):
+        """Test inbox events MCP resource."""
+        events = [MailboxEvent(type="exists", number=4)]
+        mock_handler = AsyncMock()
+        mock_handler.wait_for_inbox_events.return_value = events
+
+        with patch("mcp_email_server.app.dispatch_handler", return_value=mock_handler) as mock_dispatch:
+            result = await get_inbox_events("test_account")
+
+            assert result == events
+            mock_dispatch.assert_called_once_with("test_account")
+            mock_handler.wait_for_inbox_events.assert_called_once()
@@ -39,6 +39,30 @@ class TestEmailData:
         assert email_data.date == now
         assert email_data.attachments == ["file1.txt", "file2.pdf"]
 
+    def test_from_email_fast(self):
+        """Test from_email_fast class method."""
+        now = datetime.now()
+        email_dict = {
+            "subject": "Test Subject",
+            "from": "test@example.com",
+            "body": "Test Body",
+            "date": now,
+            "attachments": ["file1.txt"],
+            "uid": "12345",
+        }
+
+        email_data = EmailData.from_email_fast(email_dict)
+
+        assert email_data == EmailData.from_email(email_dict)
+        assert email_data.model_dump() == {
+            "subject": "Test Subject",
+            "sender": "test@example.com",
+            "body": "Test Body",
+            "date": now,
+            "attachments": ["file1.txt"],
+            "uid": "12345",
+        }
+
 
 class TestEmailPageResponse:
     def test_init(self):
@@ -0,0 +1,95 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from mcp_email_server.emails.pool import AsyncIMAPPool, get_pool
+
+
+class TestAsyncIMAPPool:
+    def test_get_pool(self):
+        """Test the shared pool is created once."""
+        assert get_pool() is get_pool()
+
+    @pytest.mark.asyncio
+    async def test_acquire_logs_in_once_and_reuses_connection(self, email_server, make_mock_imap):
+        """Test a returned connection is reused without a new login."""
+        mock_imap = make_mock_imap()
+        imap_class = MagicMock(return_value=mock_imap)
+        pool = AsyncIMAPPool()
+
+        async with pool.acquire(email_server, imap_class) as imap:
+            assert imap is mock_imap
+        async with pool.acquire(email_server, imap_class) as imap:
+            assert imap is mock_imap
+
+        imap_class.assert_called_once_with(email_server.host, email_server.port)
+        mock_imap.login.assert_called_once_with(email_server.user_name, email_server.password)
+        mock_imap.noop.assert_called_once()
+        mock_imap.logout.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_acquire_evicts_unhealthy_connection(self, email_server, make_mock_imap):
+        """Test a connection failing NOOP is logged out and replaced."""
+        stale_imap = make_mock_imap()
+        stale_imap.noop = AsyncMock(side_effect=TimeoutError())
+        fresh_imap = make_mock_imap()
+        imap_class = MagicMock(side_effect=[stale_imap, fresh_imap])
+        pool = AsyncIMAPPool()
+
+        async with pool.acquire(email_server, imap_class):
+            pass
+        async with pool.acquire(email_server, imap_class) as imap:
+            assert imap is fresh_imap
+
+        stale_imap.logout.assert_called_once()
+        assert imap_class.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_acquire_evicts_expired_connection(self, email_server, make_mock_imap):
+        """Test connections older than max_age are not returned to the pool."""
+        mock_imap = make_mock_imap()
+        pool = AsyncIMAPPool(max_age=0)
+
+        async with pool.acquire(email_server, MagicMock(return_value=mock_imap)):
+            pass
+
+        mock_imap.logout.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_acquire_evicts_connection_on_error(self, email_server, make_mock_imap):
+        """Test a connection whose block raised is logged out."""
+        mock_imap = make_mock_imap()
+        pool = AsyncIMAPPool()
+
+        with pytest.raises(ValueError):
+            async with pool.acquire(email_server, MagicMock(return_value=mock_imap)):
+                raise ValueError("Connection lost")
+
+        mock_imap.logout.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_try_acquire_does_not_wait_for_a_slot(self, email_server, make_mock_imap):
+        """Test try_acquire yields None instead of waiting when all slots are taken."""
+        imap_class = MagicMock(side_effect=lambda host, port: make_mock_imap())
+        pool = AsyncIMAPPool(max_connections_per_account=2)
+
+        async with pool.acquire(email_server, imap_class) as first:
+            async with pool.try_acquire(email_server, imap_class) as second:
+                assert second is not None
+                assert second is not first
+                async with pool.try_acquire(email_server, imap_class) as third:
+                    assert third is None
+            async with pool.try_acquire(email_server, imap_class) as reused:
+                assert reused is second
+
+    @pytest.mark.asyncio
+    async def test_close(self, email_server, make_mock_imap):
+        """Test close logs out idle connections."""
+        mock_imap = make_mock_imap()
+        pool = AsyncIMAPPool()
+
+        async with pool.acquire(email_server, MagicMock(return_value=mock_imap)):
+            pass
+        await pool.close()
+
+        mock_imap.logout.assert_called_once()